@@ -4,6 +4,12 @@ from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 from .models import ProfileUpdateRequest, User
 
 
+def _is_changelist(request):
+    """Column trimming is only safe on the changelist; change forms read every field."""
+    match = getattr(request, "resolver_match", None)
+    return bool(match and match.url_name and match.url_name.endswith("_changelist"))
+
+
 @admin.register(User)
 class UserAdmin(DjangoUserAdmin):
     model = User
@@ -16,8 +22,9 @@ class UserAdmin(DjangoUserAdmin):
         "is_account_approved",
     )
     list_filter = ("role", "is_account_approved")
+    list_select_related = False
     ordering = ("email",)
-    search_fields = ("email", "first_name", "last_name", "employee_id")
+    search_fields = ("email", "employee_id")
     fieldsets = (
         (None, {"fields": ("email", "password")}),
         (
@@ -61,9 +68,38 @@ class UserAdmin(DjangoUserAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _is_changelist(request):
+            qs = qs.only(
+                "id",
+                "email",
+                "first_name",
+                "last_name",
+                "role",
+                "employee_id",
+                "is_account_approved",
+            )
+        return qs
+
 
 @admin.register(ProfileUpdateRequest)
 class ProfileUpdateRequestAdmin(admin.ModelAdmin):
     list_display = ("user", "request_type", "status", "created_at")
     list_filter = ("request_type", "status")
     search_fields = ("user__email", "user__first_name", "user__last_name")
+    list_select_related = ("user",)
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related("user")
+        if _is_changelist(request):
+            qs = qs.only(
+                "id",
+                "request_type",
+                "status",
+                "created_at",
+                "user__email",
+                "user__first_name",
+                "user__last_name",
+            )
+        return qs
@@ -0,0 +1,29 @@
+"""Authentication backends for the accounts app."""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class FloorUsernameBackend(ModelBackend):
+    """
+    Authenticate floor users by ``floor_username``. Callers pass the
+    ``floor_username`` keyword, so ModelBackend skips these attempts without
+    a lookup or a dummy password hash.
+    """
+
+    def authenticate(self, request, floor_username=None, password=None, **kwargs):
+        if floor_username is None or password is None:
+            return None
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.get(floor_username=floor_username)
+        except UserModel.DoesNotExist:
+            # Run the hasher once to reduce the timing difference for unknown usernames.
+            UserModel().set_password(password)
+            return None
+        except UserModel.MultipleObjectsReturned:
+            # Duplicate usernames are ambiguous; refuse rather than fail with a 500.
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
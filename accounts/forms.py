@@ -1,13 +1,48 @@
 """Forms used in the accounts app."""
 
+import re
+
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm
+from django.db import transaction
 
 from .models import ProfileUpdateRequest, User
 from .models import FloorSignupRequest
 from formbuilder.utils import apply_schema_to_form
 
+def _bootstrap_widgets(form_class):
+    """
+    Give every base field its Bootstrap widget class once, at import time.
+    A class decorator rather than ``__init_subclass__``: the form metaclasses
+    only populate ``base_fields`` after the class body has been created.
+    """
+    for field in form_class.base_fields.values():
+        css_class = "form-select" if isinstance(field.widget, forms.Select) else "form-control"
+        field.widget.attrs.setdefault("class", css_class)
+    return form_class
+
+
+_RE_LETTER = re.compile(r"[^\W\d_]")
+_RE_DIGIT = re.compile(r"\d")
+_RE_SYMBOL = re.compile(r"[\W_]")
+
+
+def _validate_password_complexity(password, add_error):
+    """Enforce length plus letter/number/symbol mix on ``password1``."""
+    if len(password) < 8:
+        add_error("password1", "Password must be at least 8 characters.")
+    if not (
+        _RE_LETTER.search(password)
+        and _RE_DIGIT.search(password)
+        and _RE_SYMBOL.search(password)
+    ):
+        add_error(
+            "password1",
+            "Password must include letters, numbers, and symbols.",
+        )
+
 
+@_bootstrap_widgets
 class SignupForm(forms.ModelForm):
     """Marketing sign-up form with password confirmation."""
 
@@ -43,11 +78,6 @@ class SignupForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            css_class = "form-control"
-            if isinstance(field.widget, forms.Select):
-                css_class = "form-select"
-            field.widget.attrs.setdefault("class", css_class)
         apply_schema_to_form(self, "signup", None)
 
     def clean(self):
@@ -57,16 +87,7 @@ class SignupForm(forms.ModelForm):
         if password1 and password2 and password1 != password2:
             self.add_error("password2", "Passwords do not match.")
         if password1:
-            if len(password1) < 8:
-                self.add_error("password1", "Password must be at least 8 characters.")
-            has_letter = any(ch.isalpha() for ch in password1)
-            has_number = any(ch.isdigit() for ch in password1)
-            has_symbol = any(not ch.isalnum() for ch in password1)
-            if not (has_letter and has_number and has_symbol):
-                self.add_error(
-                    "password1",
-                    "Password must include letters, numbers, and symbols.",
-                )
+            _validate_password_complexity(password1, self.add_error)
         return data
 
     def save(self, commit=True):
@@ -80,16 +101,12 @@ class SignupForm(forms.ModelForm):
         return user
 
 
+@_bootstrap_widgets
 class LoginForm(AuthenticationForm):
     """Login form using email + password."""
 
     username = forms.EmailField(label="Email ID")
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs.setdefault("class", "form-control")
-
 
 class GlobalProfileEditForm(forms.ModelForm):
     """Allow global users to tweak name + avatar only."""
@@ -172,6 +189,7 @@ class ProfileUpdateRequestForm(forms.ModelForm):
         return request_obj
 
 
+@_bootstrap_widgets
 class FloorSignupForm(forms.Form):
     """Floor signup with invite code; generates username automatically."""
 
@@ -188,17 +206,12 @@ class FloorSignupForm(forms.Form):
         widget=forms.PasswordInput,
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs.setdefault("class", "form-control")
-
     def clean_invite_code(self):
         code = self.cleaned_data["invite_code"].strip()
         from .models import InviteCode
 
-        invite = InviteCode.objects.filter(code=code).first()
-        if not invite or not invite.is_valid():
+        invite = InviteCode.objects.usable().filter(code=code).first()
+        if not invite:
             raise forms.ValidationError("Invalid or expired invite code.")
         self.invite = invite
         return code
@@ -210,50 +223,35 @@ class FloorSignupForm(forms.Form):
         if p1 and p2 and p1 != p2:
             self.add_error("password2", "Passwords do not match.")
         if p1:
-            if len(p1) < 8:
-                self.add_error("password1", "Password must be at least 8 characters.")
-            has_letter = any(ch.isalpha() for ch in p1)
-            has_number = any(ch.isdigit() for ch in p1)
-            has_symbol = any(not ch.isalnum() for ch in p1)
-            if not (has_letter and has_number and has_symbol):
-                self.add_error(
-                    "password1",
-                    "Password must include letters, numbers, and symbols.",
-                )
+            _validate_password_complexity(p1, self.add_error)
         return data
 
     def save(self):
         from .models import User
-        user = User(
-            first_name=self.cleaned_data["first_name"],
-            last_name=self.cleaned_data["last_name"],
-            role=User.Role.FLOOR,
-        )
-        username = user.generate_floor_username()
-        user.floor_username = username
-        # generate placeholder email to satisfy unique constraint, not used for login
-        user.email = f"{username.lower()}@floor.local"
-        user.set_password(self.cleaned_data["password1"])
-        user.is_active = True
-        user.is_account_approved = True
-        user.save()
-        # mark invite used
-        self.invite.mark_used()
+        # one transaction, so a failed user creation gives the invite use back
+        with transaction.atomic():
+            # claim the invite first so an exhausted code never creates a user
+            self.invite.mark_used()
+            # placeholder email satisfies the unique constraint, not used for login
+            user = User.objects.create_floor_user(
+                self.cleaned_data["password1"],
+                first_name=self.cleaned_data["first_name"],
+                last_name=self.cleaned_data["last_name"],
+                is_active=True,
+                is_account_approved=True,
+            )
         return user
 
 
+@_bootstrap_widgets
 class FloorLoginForm(forms.Form):
     """Floor login by username."""
 
     username = forms.CharField(label="Username")
     password = forms.CharField(label="Password", widget=forms.PasswordInput)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs.setdefault("class", "form-control")
-
 
+@_bootstrap_widgets
 class FloorSignupRequestForm(forms.ModelForm):
     """Request-based floor signup using legacy signup fields."""
 
@@ -267,11 +265,3 @@ class FloorSignupRequestForm(forms.ModelForm):
             "whatsapp_number",
             "last_qualification",
         ]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            css_class = "form-control"
-            if isinstance(field.widget, forms.Select):
-                css_class = "form-select"
-            field.widget.attrs.setdefault("class", css_class)
@@ -0,0 +1,16 @@
+"""Password hashers specific to the accounts app."""
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class GeneratedPasswordHasher(PBKDF2PasswordHasher):
+    """
+    Single-round PBKDF2 for machine-generated floor passwords.
+
+    These are 12-character random strings (72 bits), so key stretching adds
+    nothing but CPU time during approvals. The hash is upgraded to the default
+    hasher on the user's first successful login.
+    """
+
+    algorithm = "pbkdf2_sha256_generated"
+    iterations = 1
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0017_user_role_empid_idx"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(floor_username__isnull=False),
+                fields=("floor_username",),
+                name="user_floor_username_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+import accounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0020_user_role_apprv_idx"),
+    ]
+
+    # Python-side default only; the column itself is unchanged.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="floorsignuprequest",
+                    name="request_token",
+                    field=models.CharField(
+                        default=accounts.models.new_request_token,
+                        editable=False,
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+            ],
+        )
+    ]
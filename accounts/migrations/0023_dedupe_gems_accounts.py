@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+def dedupe_gems_accounts(apps, schema_editor):
+    """Keep the newest gems account per user and store balances as Decimal."""
+    GemsAccount = apps.get_model("accounts", "GemsAccount")
+    seen_users = set()
+    for account in GemsAccount.objects.order_by("user_id", "-created_at"):
+        if account.user_id in seen_users:
+            account.delete()
+            continue
+        seen_users.add(account.user_id)
+        balance = account.balance
+        if hasattr(balance, "to_decimal"):
+            GemsAccount.objects.filter(pk=account.pk).update(balance=balance.to_decimal())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0021_floorsignuprequest_request_token_uuid"),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_gems_accounts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+def lowercase_request_emails(apps, schema_editor):
+    FloorSignupRequest = apps.get_model("accounts", "FloorSignupRequest")
+    for req in FloorSignupRequest.objects.only("id", "email"):
+        if req.email != req.email.lower():
+            FloorSignupRequest.objects.filter(pk=req.pk).update(email=req.email.lower())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0023_dedupe_gems_accounts"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_request_emails, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="floorsignuprequest",
+            index=models.Index(fields=["email", "-created_at"], name="floorreq_email_created_idx"),
+        ),
+    ]
@@ -1,12 +1,18 @@
 """Accounts models covering users and profile update requests."""
 
+import base64
+import os
+import secrets
+import uuid
 from decimal import Decimal, InvalidOperation
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator, RegexValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q
 from django.utils import timezone
-from django.utils.crypto import get_random_string
 try:
     from djongo import models as djongo_models
     from bson import ObjectId
@@ -14,18 +20,27 @@ except Exception:
     djongo_models = None
     ObjectId = None
 
+# Retries when a freshly generated floor username hits the unique constraint.
+FLOOR_USERNAME_ATTEMPTS = 5
+
+# Shared by every WhatsApp number field; RegexValidator compiles lazily on first use.
+_TEN_DIGIT_VALIDATOR = RegexValidator(r"^\d{10}$", "Enter 10 digit number.")
+
 
 class UserManager(BaseUserManager):
     """Custom manager using email as username."""
 
     use_in_migrations = True
 
-    def _create_user(self, email, password, **extra_fields):
+    def _create_user(self, email, password, password_hasher=None, **extra_fields):
         if not email:
             raise ValueError("The email address must be set")
         email = self.normalize_email(email)
         user = self.model(email=email, **extra_fields)
-        user.set_password(password)
+        if password_hasher:
+            user.password = make_password(password, hasher=password_hasher)
+        else:
+            user.set_password(password)
         user.save(using=self._db)
         return user
 
@@ -34,6 +49,37 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault("is_superuser", False)
         return self._create_user(email, password, **extra_fields)
 
+    def create_floor_user(self, password, email=None, floor_username=None, **extra_fields):
+        """
+        Create a floor user, drawing a new floor username whenever the
+        candidate is already taken. Without an email a placeholder derived
+        from the username is stored.
+        """
+        extra_fields.setdefault("role", self.model.Role.FLOOR)
+        username = floor_username or self.model.generate_floor_username()
+        for _ in range(FLOOR_USERNAME_ATTEMPTS):
+            # The partial unique constraint may not be built on MongoDB
+            # (partialFilterExpression cannot say IS NOT NULL), so probe
+            # first; the IntegrityError retry covers backends that enforce it.
+            if self.filter(floor_username=username).exists():
+                username = self.model.generate_floor_username()
+                continue
+            try:
+                # savepoint per attempt, so a collision inside a caller's
+                # transaction can be rolled back and retried
+                with transaction.atomic(using=self._db):
+                    return self._create_user(
+                        email or f"{username.lower()}@floor.local",
+                        password,
+                        floor_username=username,
+                        **extra_fields,
+                    )
+            except IntegrityError:
+                if not self.filter(floor_username=username).exists():
+                    raise
+                username = self.model.generate_floor_username()
+        raise ValueError("Could not generate floor username")
+
     def create_superuser(self, email, password, **extra_fields):
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
@@ -76,7 +122,7 @@ class User(AbstractUser):
     whatsapp_country_code = models.CharField(max_length=5, default="+91")
     whatsapp_number = models.CharField(
         max_length=10,
-        validators=[RegexValidator(r"^\d{10}$", "Enter 10 digit number.")],
+        validators=[_TEN_DIGIT_VALIDATOR],
     )
     last_qualification = models.CharField(max_length=100)
     employee_id = models.CharField(max_length=32, null=True, blank=True, db_index=True)
@@ -95,6 +141,19 @@ class User(AbstractUser):
 
     objects = UserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=["role", "is_account_approved"], name="user_role_apprv_idx"),
+            models.Index(fields=["role", "employee_id"], name="user_role_empid_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["floor_username"],
+                condition=models.Q(floor_username__isnull=False),
+                name="user_floor_username_unique",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
 
@@ -109,40 +168,46 @@ class User(AbstractUser):
         last_initial = (self.last_name or "X")[0].upper()
         month = join_date.strftime("%m")
         year = join_date.strftime("%y")
-        existing_ids = {
-            user.employee_id
-            for user in User.objects.all()
-            if user.employee_id and user.role == self.role and user.is_account_approved
-        }
-        serial = len(existing_ids) + 1
-        employee_id = f"{first_initial}{month}{last_initial}{year}{serial:03d}"
-        while employee_id in existing_ids:
+        prefix = f"{first_initial}{month}{last_initial}{year}"
+        # Count in the database instead of materialising every user row.
+        issued = (
+            User.objects.filter(role=self.role, is_account_approved=True)
+            .exclude(employee_id__isnull=True)
+            .exclude(employee_id="")
+            .count()
+        )
+        serial = issued + 1
+        employee_id = f"{prefix}{serial:03d}"
+        while User.objects.filter(employee_id=employee_id).exists():
             serial += 1
-            employee_id = f"{first_initial}{month}{last_initial}{year}{serial:03d}"
+            employee_id = f"{prefix}{serial:03d}"
         self.employee_id = employee_id
         return self.employee_id
 
     def save(self, *args, **kwargs):
         if self.role in {self.Role.SUPER_ADMIN, self.Role.CO_SUPER_ADMIN}:
             self.is_staff = True
-        if self.is_account_approved and not self.employee_id:
+        update_fields = kwargs.get("update_fields")
+        # Partial saves that don't write employee_id skip the ID lookup queries.
+        if (
+            self.is_account_approved
+            and not self.employee_id
+            and (update_fields is None or "employee_id" in update_fields)
+        ):
             self.generate_employee_id()
         # ensure floor usernames don't hold staff flags
         if self.role == self.Role.FLOOR:
             self.is_staff = False
         super().save(*args, **kwargs)
 
-    def generate_floor_username(self):
-        import random
-        import string
-
-        for _ in range(5):
-            candidate = "FLR-" + "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=6)
-            )
-            if not User.objects.filter(floor_username=candidate).exists():
-                return candidate
-        raise ValueError("Could not generate floor username")
+    @staticmethod
+    def generate_floor_username():
+        """
+        Return a random floor username without checking the database.
+        Collisions are caught by the unique constraint; see
+        UserManager.create_floor_user().
+        """
+        return "FLR-" + base64.b32encode(os.urandom(5)).decode()[:6]
 
 
 class GemsAccount(models.Model):
@@ -164,10 +229,10 @@ class GemsAccount(models.Model):
     def balance_decimal(self):
         """Return the balance as a Decimal usable in templates."""
         value = self.balance
-        if hasattr(value, "to_decimal"):
-            value = value.to_decimal()
         if isinstance(value, Decimal):
             return value
+        if hasattr(value, "to_decimal"):
+            return value.to_decimal()
         try:
             return Decimal(value)
         except (InvalidOperation, TypeError):
@@ -213,6 +278,15 @@ class ProfileUpdateRequest(models.Model):
         APPROVED = "approved", "Approved"
         REJECTED = "rejected", "Rejected"
 
+    # Keyed by the stored string value; request_type loads from the DB as plain str.
+    _TARGET_FIELDS = {
+        RequestType.PROFILE_PICTURE.value: "profile_picture",
+        RequestType.FIRST_NAME.value: "first_name",
+        RequestType.LAST_NAME.value: "last_name",
+        RequestType.WHATSAPP.value: "whatsapp_number",
+        RequestType.LAST_QUALIFICATION.value: "last_qualification",
+    }
+
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     request_type = models.CharField(max_length=32, choices=RequestType.choices)
     current_value = models.TextField(blank=True, null=True)
@@ -236,14 +310,7 @@ class ProfileUpdateRequest(models.Model):
         return f"{self.user.email} - {self.get_request_type_display()}"
 
     def get_target_field(self):
-        mapping = {
-            self.RequestType.PROFILE_PICTURE: "profile_picture",
-            self.RequestType.FIRST_NAME: "first_name",
-            self.RequestType.LAST_NAME: "last_name",
-            self.RequestType.WHATSAPP: "whatsapp_number",
-            self.RequestType.LAST_QUALIFICATION: "last_qualification",
-        }
-        return mapping.get(self.request_type)
+        return self._TARGET_FIELDS.get(self.request_type)
 
     def approve(self, admin_user, notes=""):
         self.status = self.Status.APPROVED
@@ -268,7 +335,15 @@ class ProfileUpdateRequest(models.Model):
             setattr(self.user, field_name, self.file_upload)
         else:
             setattr(self.user, field_name, self.updated_value)
-        self.user.save()
+        self.user.save(update_fields=[field_name])
+
+
+class InviteCodeQuerySet(models.QuerySet):
+    def usable(self):
+        """Codes that have not expired and still have uses left."""
+        return self.filter(uses__lt=F("max_uses")).filter(
+            Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())
+        )
 
 
 class InviteCode(models.Model):
@@ -280,6 +355,8 @@ class InviteCode(models.Model):
     expires_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = InviteCodeQuerySet.as_manager()
+
     def is_valid(self):
         if self.expires_at and timezone.now() > self.expires_at:
             return False
@@ -288,13 +365,29 @@ class InviteCode(models.Model):
         return True
 
     def mark_used(self):
+        """
+        Consume one use in a single conditional UPDATE so concurrent signups
+        cannot push ``uses`` past ``max_uses`` or use an expired code.
+        """
+        updated = (
+            type(self)
+            .objects.usable()
+            .filter(pk=self.pk)
+            .update(uses=F("uses") + 1)
+        )
+        if not updated:
+            raise ValidationError("Invite code has expired or is fully used.")
         self.uses += 1
-        self.save(update_fields=["uses"])
 
     def __str__(self):
         return self.code
 
 
+def new_request_token():
+    """Status-page token for a floor signup request: 32 hex chars from uuid4."""
+    return uuid.uuid4().hex
+
+
 class FloorSignupRequest(models.Model):
     class Status(models.TextChoices):
         PENDING = "pending", "Pending"
@@ -305,12 +398,15 @@ class FloorSignupRequest(models.Model):
     last_name = models.CharField(max_length=150)
     email = models.EmailField()
     whatsapp_country_code = models.CharField(max_length=5, default="+91")
-    whatsapp_number = models.CharField(max_length=10, validators=[RegexValidator(r"^\d{10}$", "Enter 10 digit number.")])
+    whatsapp_number = models.CharField(max_length=10, validators=[_TEN_DIGIT_VALIDATOR])
     last_qualification = models.CharField(max_length=100)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
     generated_username = models.CharField(max_length=32, blank=True)
     generated_password = models.CharField(max_length=64, blank=True)
-    request_token = models.CharField(max_length=64, unique=True, default=get_random_string)
+    # Stays a CharField: tokens issued before the uuid4 default are 12-char strings.
+    request_token = models.CharField(
+        max_length=64, unique=True, default=new_request_token, editable=False
+    )
     decision_notes = models.TextField(blank=True)
     decided_by = models.ForeignKey(
         User,
@@ -323,22 +419,20 @@ class FloorSignupRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     creds_viewed = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["email", "-created_at"], name="floorreq_email_created_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Stored lowercase so status lookups can use an exact, indexed match.
+        if self.email:
+            self.email = self.email.lower()
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.email} ({self.get_status_display()})"
 
     def generate_credentials(self):
-        """Generate unique username/password for floor login."""
-        import random
-        import string
-        from accounts.models import User  # local import to avoid circular
-
-        chars = string.ascii_uppercase + string.digits
-        for _ in range(10):
-            username = "FLR-" + "".join(random.choices(chars, k=6))
-            if not User.objects.filter(floor_username=username).exists():
-                password = get_random_string(12)
-                return username, password
-        # last resort fallback
-        username = "FLR-" + get_random_string(8, allowed_chars=chars)
-        password = get_random_string(12)
-        return username, password
+        """Generate username/password for floor login; uniqueness is enforced on save."""
+        return User.generate_floor_username(), secrets.token_urlsafe(9)
@@ -0,0 +1,98 @@
+"""OIDC provider helpers for Global SSO."""
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+DEFAULT_ISSUER = "https://accounts.google.com"
+DISCOVERY_CACHE_TTL = 60 * 60 * 24  # 24 hours
+
+# Google's published endpoints, used if discovery is unreachable.
+GOOGLE_FALLBACK_CONFIG = {
+    "issuer": DEFAULT_ISSUER,
+    "authorization_endpoint": "https://accounts.google.com/o/oauth2/v2/auth",
+    "token_endpoint": "https://oauth2.googleapis.com/token",
+    "userinfo_endpoint": "https://openidconnect.googleapis.com/v1/userinfo",
+    "jwks_uri": "https://www.googleapis.com/oauth2/v3/certs",
+}
+
+# Shared keep-alive session so repeat logins reuse TLS connections.
+http = requests.Session()
+http.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+
+def get_issuer():
+    return (getattr(settings, "GLOBAL_OIDC_ISSUER", "") or DEFAULT_ISSUER).rstrip("/")
+
+
+def get_oidc_config():
+    """Return the provider's discovery document, cached for a day; None if unavailable."""
+
+    issuer = get_issuer()
+    cache_key = f"oidc_cfg:{issuer}"
+    config = cache.get(cache_key)
+    if config:
+        return config
+    try:
+        resp = http.get(f"{issuer}/.well-known/openid-configuration", timeout=5)
+        resp.raise_for_status()
+        config = resp.json()
+    except (requests.RequestException, ValueError):
+        return GOOGLE_FALLBACK_CONFIG if issuer == DEFAULT_ISSUER else None
+    cache.set(cache_key, config, DISCOVERY_CACHE_TTL)
+    return config
+
+
+GOOGLE_PEM_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = {"accounts.google.com", "https://accounts.google.com"}
+# Tolerate small clock drift against Google on the iat/exp checks.
+ID_TOKEN_CLOCK_SKEW = 10  # seconds
+
+
+def _google_signing_certs(refresh=False):
+    cache_key = "oidc_certs:google"
+    certs = None if refresh else cache.get(cache_key)
+    if not certs:
+        resp = http.get(GOOGLE_PEM_CERTS_URL, timeout=5)
+        resp.raise_for_status()
+        certs = resp.json()
+        cache.set(cache_key, certs, DISCOVERY_CACHE_TTL)
+    return certs
+
+
+def decode_id_token(id_token, client_id):
+    """
+    Verify a Google ID token against cached signing certs and return its claims.
+    Returns None when the token can't be checked locally (non-Google issuer or
+    certs unreachable), so the caller falls back to the userinfo endpoint.
+    Raises ValueError for invalid tokens.
+    """
+
+    if get_issuer() != DEFAULT_ISSUER:
+        return None
+    from google.auth import jwt as google_jwt
+
+    def _decode(certs):
+        return google_jwt.decode(
+            id_token,
+            certs=certs,
+            audience=client_id,
+            clock_skew_in_seconds=ID_TOKEN_CLOCK_SKEW,
+        )
+
+    try:
+        try:
+            claims = _decode(_google_signing_certs())
+        except ValueError as exc:
+            # Only a signature or unknown key id can mean the keys rotated since
+            # they were cached; expiry/audience errors would fail again anyway.
+            message = str(exc)
+            if "signature" not in message and "key id" not in message:
+                raise
+            claims = _decode(_google_signing_certs(refresh=True))
+    except requests.RequestException:
+        return None
+    if claims.get("iss") not in GOOGLE_ISSUERS:
+        raise ValueError("ID token issuer mismatch")
+    return claims
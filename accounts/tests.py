@@ -1,3 +1,63 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.exceptions import ValidationError
 from django.test import TestCase
+from django.utils import timezone
+
+from .models import InviteCode, User
+
+
+class CreateFloorUserTests(TestCase):
+    def test_username_collision_is_retried(self):
+        User.objects.create_floor_user("Secret#123", floor_username="FLR-TAKEN1")
+
+        with mock.patch.object(
+            User, "generate_floor_username", side_effect=["FLR-TAKEN1", "FLR-FRESH1"]
+        ) as generate:
+            user = User.objects.create_floor_user("Secret#123")
+
+        self.assertEqual(user.floor_username, "FLR-FRESH1")
+        self.assertEqual(generate.call_count, 2)
+        self.assertEqual(User.objects.filter(role=User.Role.FLOOR).count(), 2)
+
+
+class InviteCodeMarkUsedTests(TestCase):
+    def test_counts_a_use(self):
+        invite = InviteCode.objects.create(code="OPEN1", max_uses=2)
+
+        invite.mark_used()
+
+        invite.refresh_from_db()
+        self.assertEqual(invite.uses, 1)
+
+    def test_exhausted_code_is_rejected(self):
+        invite = InviteCode.objects.create(code="USED1", max_uses=1, uses=1)
+
+        with self.assertRaises(ValidationError):
+            invite.mark_used()
+
+        invite.refresh_from_db()
+        self.assertEqual(invite.uses, 1)
+
+    def test_stale_instance_cannot_overuse_code(self):
+        invite = InviteCode.objects.create(code="RACE1", max_uses=1)
+        other = InviteCode.objects.get(pk=invite.pk)
+
+        invite.mark_used()
+        with self.assertRaises(ValidationError):
+            other.mark_used()
+
+        invite.refresh_from_db()
+        self.assertEqual(invite.uses, 1)
+
+    def test_expired_code_is_rejected(self):
+        invite = InviteCode.objects.create(
+            code="OLD1", max_uses=5, expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        with self.assertRaises(ValidationError):
+            invite.mark_used()
 
-# Create your tests here.
+        invite.refresh_from_db()
+        self.assertEqual(invite.uses, 0)
@@ -1,7 +1,10 @@
 """Views for authentication, profile, and request flows."""
 
+import logging
+from functools import lru_cache
+
 from django.contrib import messages
-from django.contrib.auth import logout, login as auth_login
+from django.contrib.auth import authenticate, logout, login as auth_login
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.views import LoginView
 from django.shortcuts import redirect, render
@@ -9,20 +12,14 @@ from django.conf import settings
 from django.utils.crypto import get_random_string
 from urllib.parse import urlencode
 from django.core.paginator import Paginator
+from django.db import transaction
 from django.urls import reverse_lazy, reverse
 from django.utils.decorators import method_decorator
 from django.views.generic import FormView, TemplateView
 from django.views import View
-import requests
 from django.http import HttpResponseRedirect
 
 from decimal import Decimal
-try:
-    from bson.decimal128 import Decimal128
-    from bson.objectid import ObjectId
-except Exception:
-    Decimal128 = None
-    ObjectId = None
 from common.mixins import ManagementSystemGateMixin
 from common.models import ManagementSystem
 from common.system_control import is_system_enabled
@@ -35,76 +32,49 @@ from .forms import (
     FloorSignupRequestForm,
 )
 from .models import ProfileUpdateRequest, User, FloorSignupRequest, GemsAccount, GemTransaction
+from .oidc import decode_id_token, get_oidc_config, http as oidc_http
+
+logger = logging.getLogger(__name__)
+
+WELCOME_BONUS_GEMS = Decimal("50")
 
 
 def ensure_gems_account(user, reason="Welcome bonus"):
     """
-    Guarantee a gems account with a clean PK and Decimal balance.
-    Older rows coming from Mongo can have ObjectId PKs or Decimal128 balances;
-    we rebuild those rows to avoid conversion errors during save().
+    Return the user's gems account, creating it with the welcome bonus on
+    first use. Repeat logins cost a single lookup.
     """
 
-    def coerce_decimal(val):
-        if Decimal128 and isinstance(val, Decimal128):
-            val = val.to_decimal()
-        try:
-            return Decimal(str(val))
-        except Exception:
-            return Decimal("0")
-
-    # If duplicates exist (possible after schema changes), consolidate to a single row.
-    accounts_qs = list(GemsAccount.objects.filter(user=user).order_by("-created_at"))
-    if len(accounts_qs) > 1:
-        for extra in accounts_qs[1:]:
-            extra.delete()
-    account = accounts_qs[0] if accounts_qs else None
-    created = False
-
-    if account:
-        coerced_bal = coerce_decimal(account.balance)
-        pk_val = getattr(account, "pk", None)
-        pk_bad = pk_val is None
-        if pk_bad:
-            if pk_val:
-                account.delete()
-            account = GemsAccount.objects.create(user=user, balance=coerced_bal)
-            created = True
-        else:
-            account.balance = coerced_bal
-            try:
-                account.save()
-            except Exception:
-                if getattr(account, "pk", None):
-                    account.delete()
-                account = GemsAccount.objects.create(user=user, balance=coerced_bal)
-                created = True
-    else:
-        account = GemsAccount.objects.create(user=user, balance=Decimal("0"))
-        created = True
-
-    # Apply welcome bonus only once (brand new account with zero balance)
-    if account.balance == 0 and created:
-        account.balance = Decimal("50")
-        account.save()
-        GemTransaction.objects.create(
-            user=user,
-            amount=Decimal("50"),
-            reason=reason,
-            created_by=None,
+    with transaction.atomic():
+        account, created = GemsAccount.objects.get_or_create(
+            user=user, defaults={"balance": WELCOME_BONUS_GEMS}
         )
+        if created:
+            GemTransaction.objects.create(
+                user=user,
+                amount=WELCOME_BONUS_GEMS,
+                reason=reason,
+                created_by=None,
+            )
     return account
 
 
+ROLE_HOME_URL_NAMES = {
+    User.Role.SUPER_ADMIN: "superadmin:welcome",
+    User.Role.CO_SUPER_ADMIN: "superadmin:welcome",
+    User.Role.GLOBAL: "marketing:global_home",
+    User.Role.MARKETING: "marketing:welcome",
+    User.Role.FLOOR: "common:welcome",
+}
+
+
+@lru_cache(maxsize=None)
+def _role_home_url(role):
+    return reverse(ROLE_HOME_URL_NAMES.get(role, "common:welcome"))
+
+
 def role_home_url(user):
-    if user.role in {User.Role.SUPER_ADMIN, User.Role.CO_SUPER_ADMIN}:
-        return reverse("superadmin:welcome")
-    if user.role == User.Role.GLOBAL:
-        return reverse("marketing:global_home")
-    if user.role == User.Role.MARKETING:
-        return reverse("marketing:welcome")
-    if user.role == User.Role.FLOOR:
-        return reverse("common:welcome")
-    return reverse("common:welcome")
+    return _role_home_url(user.role)
 
 
 class SignupView(ManagementSystemGateMixin, FormView):
@@ -170,9 +140,13 @@ class GlobalSSOStartView(View):
         if not all([client_id, redirect_uri]):
             messages.error(request, "Global SSO is not configured.")
             return redirect("accounts:login")
+        oidc_config = get_oidc_config()
+        if not oidc_config:
+            messages.error(request, "Global SSO provider is unavailable.")
+            return redirect("accounts:login")
         state = get_random_string(24)
         request.session["global_oidc_state"] = state
-        authorize = "https://accounts.google.com/o/oauth2/v2/auth"
+        authorize = oidc_config["authorization_endpoint"]
         params = {
             "response_type": "code",
             "client_id": client_id,
@@ -203,10 +177,14 @@ class GlobalSSOCallbackView(View):
         if not all([client_id, client_secret, redirect_uri]):
             messages.error(request, "Global SSO is not fully configured.")
             return redirect("accounts:login")
-        token_url = "https://oauth2.googleapis.com/token"
-        userinfo_url = "https://openidconnect.googleapis.com/v1/userinfo"
+        oidc_config = get_oidc_config()
+        if not oidc_config:
+            messages.error(request, "Global SSO provider is unavailable.")
+            return redirect("accounts:login")
+        token_url = oidc_config["token_endpoint"]
+        userinfo_url = oidc_config["userinfo_endpoint"]
         try:
-            resp = requests.post(
+            resp = oidc_http.post(
                 token_url,
                 data={
                     "grant_type": "authorization_code",
@@ -220,30 +198,32 @@ class GlobalSSOCallbackView(View):
             )
             if resp.status_code != 200:
                 messages.error(request, f"Token exchange failed ({resp.status_code}).")
-                try:
-                    print("Token error:", resp.text)
-                except Exception:
-                    pass
+                logger.warning("Token exchange failed: %s", resp.text[:500])
                 return redirect("accounts:login")
             data = resp.json()
             access_token = data.get("access_token")
             if not access_token:
                 messages.error(request, "Token exchange failed: no access token.")
                 return redirect("accounts:login")
-            # Fetch userinfo
-            uresp = requests.get(
-                userinfo_url,
-                headers={"Authorization": f"Bearer {access_token}"},
-                timeout=10,
-            )
-            if uresp.status_code != 200:
-                messages.error(request, f"Userinfo fetch failed ({uresp.status_code}).")
+            # Prefer the ID token's claims; only hit userinfo when it can't be verified locally.
+            uinfo = None
+            if data.get("id_token"):
                 try:
-                    print("Userinfo error:", uresp.text)
-                except Exception:
-                    pass
-                return redirect("accounts:login")
-            uinfo = uresp.json()
+                    uinfo = decode_id_token(data["id_token"], client_id)
+                except ValueError:
+                    messages.error(request, "Could not verify the identity token.")
+                    return redirect("accounts:login")
+            if uinfo is None:
+                uresp = oidc_http.get(
+                    userinfo_url,
+                    headers={"Authorization": f"Bearer {access_token}"},
+                    timeout=10,
+                )
+                if uresp.status_code != 200:
+                    messages.error(request, f"Userinfo fetch failed ({uresp.status_code}).")
+                    logger.warning("Userinfo fetch failed: %s", uresp.text[:500])
+                    return redirect("accounts:login")
+                uinfo = uresp.json()
             email = uinfo.get("email")
             if not email:
                 messages.error(request, "No email returned from provider.")
@@ -251,7 +231,8 @@ class GlobalSSOCallbackView(View):
             first_name = uinfo.get("given_name", "")
             last_name = uinfo.get("family_name", "")
             user = User.objects.filter(email__iexact=email).first()
-            created_user = False
+            login_ip = request.META.get("REMOTE_ADDR") or ""
+            login_timezone = request.META.get("TZ") or ""
             if not user:
                 user = User(
                     email=email,
@@ -260,37 +241,39 @@ class GlobalSSOCallbackView(View):
                     role=User.Role.GLOBAL,
                     is_account_approved=True,
                     is_active=True,
+                    last_login_ip=login_ip,
+                    last_login_timezone=login_timezone,
                 )
                 user.set_unusable_password()
                 user.save()
-                created_user = True
             else:
-                # if existing user, update names if blank
-                updated = False
+                # fill blank names, force the global role and capture login meta in one UPDATE
+                dirty = set()
                 if not user.first_name and first_name:
                     user.first_name = first_name
-                    updated = True
+                    dirty.add("first_name")
                 if not user.last_name and last_name:
                     user.last_name = last_name
-                    updated = True
+                    dirty.add("last_name")
                 if user.role != User.Role.GLOBAL:
                     user.role = User.Role.GLOBAL
-                    updated = True
-                if updated:
-                    user.save(update_fields=["first_name", "last_name", "role"])
+                    dirty.add("role")
+                if user.last_login_ip != login_ip:
+                    user.last_login_ip = login_ip
+                    dirty.add("last_login_ip")
+                if user.last_login_timezone != login_timezone:
+                    user.last_login_timezone = login_timezone
+                    dirty.add("last_login_timezone")
+                if dirty:
+                    user.save(update_fields=sorted(dirty))
             # ensure gems account
             ensure_gems_account(user, "Welcome bonus")
-            # capture basic login meta
-            user.last_login_ip = request.META.get("REMOTE_ADDR") or ""
-            user.last_login_timezone = request.META.get("TZ") or ""
-            user.save(update_fields=["last_login_ip", "last_login_timezone"])
             auth_login(request, user)
             messages.success(request, "Logged in via Global SSO.")
             return redirect(role_home_url(user))
         except Exception:
             messages.error(request, "Global SSO login failed. Please try again.")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Global SSO login failed")
             return redirect("accounts:login")
 
 
@@ -311,15 +294,12 @@ class FloorLoginView(FormView):
     success_url = reverse_lazy("marketing:welcome")
 
     def form_valid(self, form):
-        from .models import User
         username = form.cleaned_data["username"].strip()
         password = form.cleaned_data["password"]
         # Allow login by floor username even if the role was later updated (e.g., to Marketing)
-        user = User.objects.filter(floor_username=username).first()
-
-        if user and user.check_password(password):
-            from django.contrib.auth import login as auth_login
+        user = authenticate(self.request, floor_username=username, password=password)
 
+        if user:
             auth_login(self.request, user)
             ensure_gems_account(user, "Welcome bonus")
             return HttpResponseRedirect(role_home_url(user))
@@ -357,7 +337,7 @@ class FloorStatusLookupView(View):
     def post(self, request):
         email = request.POST.get("email", "").strip().lower()
         result = (
-            FloorSignupRequest.objects.filter(email__iexact=email)
+            FloorSignupRequest.objects.filter(email=email)
             .order_by("-created_at")
             .first()
         )
@@ -380,15 +360,14 @@ class ProfileView(ManagementSystemGateMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
-        requests_qs = ProfileUpdateRequest.objects.filter(user=user).order_by(
-            "-created_at"
+        requests_qs = (
+            ProfileUpdateRequest.objects.filter(user=user)
+            .only("id", "request_type", "status", "updated_value", "created_at")
+            .order_by("-created_at")
         )
         paginator = Paginator(requests_qs, 5)
         page_number = self.request.GET.get("page")
-        page_obj = paginator.get_page(page_number)
-        context["profile_requests"] = page_obj
-        context["requests_paginator"] = paginator
-        context["requests_page_obj"] = page_obj
+        context["profile_requests"] = paginator.get_page(page_number)
         return context
 
 
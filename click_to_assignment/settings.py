@@ -7,7 +7,9 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.getenv("SECRET_KEY", "change-me-in-.env")
-DEBUG = False
+# Off unless explicitly enabled; with DEBUG off Django also wraps the template
+# loaders in the cached loader, since TEMPLATES sets no explicit "loaders".
+DEBUG = os.getenv("DJANGO_DEBUG", "0").lower() in {"1", "true", "yes"}
 
 ALLOWED_HOSTS = ['*']
 
@@ -34,6 +36,7 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "common.middleware.SlidingSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -80,8 +83,12 @@ DATABASES = {
         "ENGINE": "djongo",
         "NAME": os.getenv("MONGO_DB_NAME", "click_assignment"),
         "ENFORCE_SCHEMA": False,
+        # Keep connections across requests; signup/login and admin changelists
+        # are short queries where the handshake would otherwise dominate.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "600")),
         "CLIENT": {
             "host": os.getenv("MONGO_URI"),
+            "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
         },
     }
 }
@@ -91,6 +98,20 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
 AUTH_USER_MODEL = "accounts.User"
 
+AUTHENTICATION_BACKENDS = [
+    "django.contrib.auth.backends.ModelBackend",
+    "accounts.auth_backends.FloorUsernameBackend",
+]
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    # cheap hash for auto-generated floor passwords; upgraded on first login
+    "accounts.hashers.GeneratedPasswordHasher",
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -122,7 +143,15 @@ LOGIN_REDIRECT_URL = "common:welcome"
 LOGOUT_REDIRECT_URL = "accounts:login"
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 SESSION_COOKIE_AGE = 30 * 60  # 30 minutes
-SESSION_SAVE_EVERY_REQUEST = True  # sliding idle timeout
+# Sliding idle timeout: SlidingSessionMiddleware re-saves the session at most
+# once per SESSION_TOUCH_INTERVAL seconds instead of on every request.
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_TOUCH_INTERVAL = 60
+
+# Activity log volume: skipped path prefixes (static/media are always skipped)
+# and the share of successful GET requests that are recorded.
+ACTIVITY_LOG_EXCLUDE_PREFIXES = ("/favicon", "/healthz", "/robots.txt")
+ACTIVITY_LOG_SAMPLE_RATE = float(os.getenv("ACTIVITY_LOG_SAMPLE_RATE", "0.1"))
 
 # Global OAuth2 / OIDC (Keycloak-ready) placeholders
 GLOBAL_OIDC_ISSUER = os.getenv("GLOBAL_OIDC_ISSUER", "")
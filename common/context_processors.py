@@ -1,5 +1,9 @@
 """Context processors shared across templates."""
 
+from types import MappingProxyType
+
+from django.core.cache import cache
+
 from accounts.models import (
     FloorSignupRequest,
     GemsAccount,
@@ -9,12 +13,41 @@ from accounts.models import (
 from jobs.models import Job
 
 from .system_control import get_management_system_map
+from .utils import recent_visited_job_ids
 
 try:
     from navbuilder.models import NavigationItem
 except Exception:
     NavigationItem = None
 
+NAV_COUNTS_TTL = 30  # seconds; badges tolerate brief staleness
+NAV_COUNTS_VERSION_KEY = "navcounts:version"
+SUPERADMIN_ROLES = {User.Role.SUPER_ADMIN, User.Role.CO_SUPER_ADMIN}
+
+
+def _zero_counts():
+    return {
+        "marketing": {"new_jobs": 0, "deleted_jobs": 0},
+        "superadmin": {
+            "new_jobs": 0,
+            "user_approvals": 0,
+            "profile_requests": 0,
+            "floor_signups": 0,
+        },
+    }
+
+
+# Shared, read-only context for anonymous requests (login pages, public forms).
+_EMPTY_CTX = MappingProxyType(
+    {
+        "nav_counts": _zero_counts(),
+        "management_systems": {},
+        "gems_balance": None,
+        "is_global_user": False,
+        "nav_items": (),
+    }
+)
+
 
 def _unread_count(request, actual, session_key):
     seen = request.session.get(session_key, 0)
@@ -24,90 +57,107 @@ def _unread_count(request, actual, session_key):
     return max(actual - seen, 0)
 
 
+def invalidate_nav_counts():
+    """Expire every cached badge total; called from model save/delete signals."""
+    try:
+        cache.incr(NAV_COUNTS_VERSION_KEY)
+    except ValueError:
+        cache.set(NAV_COUNTS_VERSION_KEY, 1, None)
+
+
+def _badge_totals(user):
+    """
+    Raw badge totals for the user's role, cached for NAV_COUNTS_TTL seconds.
+    Pending jobs are kept as ids so each session can drop the ones it visited.
+    """
+    version = cache.get_or_set(NAV_COUNTS_VERSION_KEY, 1, None)
+    scope = "admin" if user.role in SUPERADMIN_ROLES else user.pk
+    cache_key = f"navcounts:{version}:{scope}"
+    totals = cache.get(cache_key)
+    if totals is not None:
+        return totals
+
+    if user.role == User.Role.MARKETING:
+        own_jobs = Job.objects.filter(created_by=user)
+        totals = {
+            "pending_job_ids": list(
+                own_jobs.filter(is_superadmin_approved=False, is_deleted=False)
+                .values_list("pk", flat=True)
+            ),
+            "deleted_jobs": own_jobs.filter(is_deleted=True).count(),
+        }
+    elif user.role in SUPERADMIN_ROLES:
+        totals = {
+            "pending_job_ids": list(
+                Job.objects.filter(is_superadmin_approved=False, is_deleted=False)
+                .values_list("pk", flat=True)
+            ),
+            "user_approvals": User.objects.filter(
+                role=User.Role.MARKETING, is_active=True, is_account_approved=False
+            ).count(),
+            "floor_signups": FloorSignupRequest.objects.filter(
+                status=FloorSignupRequest.Status.PENDING
+            ).count(),
+            "profile_requests": ProfileUpdateRequest.objects.filter(
+                status=ProfileUpdateRequest.Status.PENDING
+            ).count(),
+        }
+    else:
+        totals = {}
+    cache.set(cache_key, totals, NAV_COUNTS_TTL)
+    return totals
+
+
 def global_counts(request):
     """Expose notification badges for nav/sidebars."""
 
-    counts = {
-        "marketing": {"new_jobs": 0, "deleted_jobs": 0},
-        "superadmin": {
-            "new_jobs": 0,
-            "user_approvals": 0,
-            "profile_requests": 0,
-            "floor_signups": 0,
-        },
-    }
-
     user = getattr(request, "user", None)
-    is_auth = bool(user and getattr(user, "is_authenticated", False))
-    is_global = bool(
-        is_auth and getattr(user, "role", None) == User.Role.GLOBAL
-    )
-    visited_jobs = set(request.session.get("visited_job_ids", []))
+    if not (user and user.is_authenticated):
+        return _EMPTY_CTX
+
+    cached = getattr(request, "_global_counts_cached", None)
+    if cached is not None:
+        return cached
+
+    counts = _zero_counts()
+    visited_jobs = set(recent_visited_job_ids(request.session))
     data = {
         "nav_counts": counts,
         "management_systems": get_management_system_map(user),
         "gems_balance": None,
-        "is_global_user": is_global,
+        "is_global_user": user.role == User.Role.GLOBAL,
     }
-    if not user or not user.is_authenticated:
-        return data
 
+    totals = _badge_totals(user)
     if user.role == User.Role.MARKETING:
-        base_jobs = list(Job.objects.filter(created_by=user))
-        pending_jobs = len(
-            [
-                job
-                for job in base_jobs
-                if not job.is_superadmin_approved
-                and not job.is_deleted
-                and job.pk not in visited_jobs
-            ]
-        )
+        pending_jobs = len(set(totals["pending_job_ids"]) - visited_jobs)
         counts["marketing"]["new_jobs"] = _unread_count(
             request, pending_jobs, "seen_marketing_new_jobs"
         )
-        deleted_jobs = len([job for job in base_jobs if job.is_deleted])
         counts["marketing"]["deleted_jobs"] = _unread_count(
-            request, deleted_jobs, "seen_marketing_deleted_jobs"
+            request, totals["deleted_jobs"], "seen_marketing_deleted_jobs"
         )
-    elif user.role in {User.Role.SUPER_ADMIN, User.Role.CO_SUPER_ADMIN}:
-        jobs = list(Job.objects.all())
-        new_jobs = [
-            job
-            for job in jobs
-            if not job.is_superadmin_approved and not job.is_deleted and job.pk not in visited_jobs
-        ]
+    elif user.role in SUPERADMIN_ROLES:
+        new_jobs = len(set(totals["pending_job_ids"]) - visited_jobs)
         counts["superadmin"]["new_jobs"] = _unread_count(
-            request, len(new_jobs), "seen_superadmin_new_jobs"
+            request, new_jobs, "seen_superadmin_new_jobs"
         )
-        pending_users = [
-            marketing_user
-            for marketing_user in User.objects.filter(role=User.Role.MARKETING)
-            if marketing_user.is_active and not marketing_user.is_account_approved
-        ]
         counts["superadmin"]["user_approvals"] = _unread_count(
-            request, len(pending_users), "seen_superadmin_user_approvals"
+            request, totals["user_approvals"], "seen_superadmin_user_approvals"
         )
-        pending_floor = FloorSignupRequest.objects.filter(
-            status=FloorSignupRequest.Status.PENDING
-        ).count()
         counts["superadmin"]["floor_signups"] = _unread_count(
-            request, pending_floor, "seen_superadmin_floor_signups"
+            request, totals["floor_signups"], "seen_superadmin_floor_signups"
         )
-        profile_requests = [
-            prof_request
-            for prof_request in ProfileUpdateRequest.objects.all()
-            if prof_request.status == ProfileUpdateRequest.Status.PENDING
-        ]
         counts["superadmin"]["profile_requests"] = _unread_count(
-            request, len(profile_requests), "seen_superadmin_profile_requests"
+            request, totals["profile_requests"], "seen_superadmin_profile_requests"
         )
 
     if NavigationItem:
+        # Sidebars only read these columns; NavigationItem has no relations to join.
         nav_items = list(
-            NavigationItem.objects.filter(role=user.role, is_active=True).order_by(
-                "order", "id"
-            )
+            NavigationItem.objects.filter(role=user.role, is_active=True)
+            .only("id", "label", "url_name", "badge_key", "order")
+            .order_by("order", "id")
         )
         data["nav_items"] = nav_items
 
@@ -122,4 +172,5 @@ def global_counts(request):
         balance = None
     data["gems_balance"] = balance
 
+    request._global_counts_cached = data
     return data
@@ -1,37 +1,155 @@
+import atexit
+import logging
+import os
+import queue
+import random
+import re
+import threading
 import time
 import traceback
+import uuid
 
+from django.conf import settings
+from django.db import close_old_connections
 from django.utils.deprecation import MiddlewareMixin
 
 from common.models import ActivityLog, ErrorLog
 
+logger = logging.getLogger(__name__)
+
+# Log rows are queued here and written in batches by a per-process daemon
+# thread, keeping the INSERT off the request path. Overflow is dropped.
+_LOG_QUEUE = queue.Queue(maxsize=10000)
+_LOG_BATCH_SIZE = 500
+_LOG_FLUSH_WAIT = 1.0  # seconds to wait for more rows before writing a partial batch
+_SKIP_PREFIXES = (settings.STATIC_URL, settings.MEDIA_URL) + tuple(
+    getattr(settings, "ACTIVITY_LOG_EXCLUDE_PREFIXES", ())
+)
+# Share of successful GETs that get logged; writes and 4xx/5xx are always kept.
+_SAMPLE_RATE = getattr(settings, "ACTIVITY_LOG_SAMPLE_RATE", 0.1)
+# ErrorLog keeps 8000 chars of traceback, so deeper frames would be cut anyway.
+_TRACEBACK_FRAME_LIMIT = 20
+# Client-supplied request IDs are echoed and logged, so only short tokens pass.
+_REQUEST_ID_RE = re.compile(r"[A-Za-z0-9-]{1,64}")
+
+_writer_lock = threading.Lock()
+_writer_pid = None
+
+
+def _write_batch(batch):
+    # The writer thread holds its own connection; drop it if it has gone
+    # stale so one dead connection doesn't fail every later batch.
+    close_old_connections()
+    by_model = {}
+    for entry in batch:
+        by_model.setdefault(type(entry), []).append(entry)
+    for model, rows in by_model.items():
+        try:
+            model.objects.bulk_create(rows, batch_size=_LOG_BATCH_SIZE)
+        except Exception:
+            logger.exception(
+                "Batch insert of %d %s rows failed; retrying row by row",
+                len(rows),
+                model.__name__,
+            )
+            for row in rows:
+                try:
+                    row.save(force_insert=True)
+                except Exception:
+                    logger.exception("Dropped a %s row", model.__name__)
+
+
+def _drain_forever():
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        try:
+            while len(batch) < _LOG_BATCH_SIZE:
+                batch.append(_LOG_QUEUE.get(timeout=_LOG_FLUSH_WAIT))
+        except queue.Empty:
+            pass
+        _write_batch(batch)
+
+
+def _flush_pending():
+    batch = []
+    while True:
+        try:
+            batch.append(_LOG_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _write_batch(batch)
+
+
+def _ensure_writer():
+    # Started lazily and per PID so forked workers each get their own thread.
+    global _writer_pid
+    if _writer_pid == os.getpid():
+        return
+    with _writer_lock:
+        if _writer_pid != os.getpid():
+            threading.Thread(
+                target=_drain_forever, name="activity-log-writer", daemon=True
+            ).start()
+            _writer_pid = os.getpid()
+
+
+def _enqueue(entry):
+    _ensure_writer()
+    try:
+        _LOG_QUEUE.put_nowait(entry)
+    except queue.Full:
+        pass
+
+
+atexit.register(_flush_pending)
+
 
 class ActivityLogMiddleware(MiddlewareMixin):
     """Capture request/response metadata for auditing."""
 
     def process_request(self, request):
         request._start_time = time.monotonic()
+        request_id = request.META.get("HTTP_X_REQUEST_ID", "")
+        if not _REQUEST_ID_RE.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
 
     def process_response(self, request, response):
+        request_id = getattr(request, "request_id", "")
+        if request_id:
+            response["X-Request-ID"] = request_id
         try:
+            if request.path.startswith(_SKIP_PREFIXES):
+                return response
+            status_code = getattr(response, "status_code", 0)
+            if (
+                request.method == "GET"
+                and status_code < 400
+                and random.random() >= _SAMPLE_RATE
+            ):
+                return response
             duration = 0
             if hasattr(request, "_start_time"):
                 duration = (time.monotonic() - request._start_time) * 1000
             user = getattr(request, "user", None) if hasattr(request, "user") else None
-            ActivityLog.objects.create(
-                user=user if getattr(user, "is_authenticated", False) else None,
-                path=request.path[:512],
-                method=request.method,
-                status_code=getattr(response, "status_code", 0),
-                ip_address=request.META.get("REMOTE_ADDR"),
-                user_agent=request.META.get("HTTP_USER_AGENT", ""),
-                referrer=request.META.get("HTTP_REFERER", ""),
-                duration_ms=duration,
-                action_type="request",
-                extra_meta={
-                    "role": getattr(user, "role", None) if user else None,
-                },
-                session_key=getattr(request, "session", None) and request.session.session_key or "",
+            _enqueue(
+                ActivityLog(
+                    user=user if getattr(user, "is_authenticated", False) else None,
+                    path=request.path[:512],
+                    method=request.method[:10],
+                    status_code=status_code,
+                    ip_address=request.META.get("REMOTE_ADDR"),
+                    user_agent=request.META.get("HTTP_USER_AGENT", "")[:512],
+                    referrer=request.META.get("HTTP_REFERER", "")[:512],
+                    duration_ms=duration,
+                    action_type="request",
+                    extra_meta={
+                        "role": getattr(user, "role", None) if user else None,
+                        "request_id": request_id,
+                    },
+                    session_key=(getattr(request, "session", None) and request.session.session_key or "")[:64],
+                )
             )
         except Exception:
             # Fail-safe: never break the request pipeline
@@ -42,17 +160,44 @@ class ActivityLogMiddleware(MiddlewareMixin):
         """Capture unhandled exceptions into ErrorLog and re-raise downstream."""
         try:
             user = getattr(request, "user", None) if hasattr(request, "user") else None
-            ErrorLog.objects.create(
-                user=user if getattr(user, "is_authenticated", False) else None,
-                path=getattr(request, "path", "")[:512],
-                method=getattr(request, "method", "")[:10],
-                status_code=500,
-                message=str(exception)[:2000],
-                traceback="".join(traceback.format_exception(type(exception), exception, exception.__traceback__))[:8000],
-                ip_address=request.META.get("REMOTE_ADDR"),
-                user_agent=request.META.get("HTTP_USER_AGENT", "")[:512],
-                referrer=request.META.get("HTTP_REFERER", "")[:512],
+            tb = traceback.format_exception(
+                type(exception),
+                exception,
+                exception.__traceback__,
+                limit=_TRACEBACK_FRAME_LIMIT,
+            )
+            _enqueue(
+                ErrorLog(
+                    user=user if getattr(user, "is_authenticated", False) else None,
+                    path=getattr(request, "path", "")[:512],
+                    method=getattr(request, "method", "")[:10],
+                    status_code=500,
+                    message=repr(exception)[:2000],
+                    traceback="".join(tb)[:8000],
+                    ip_address=request.META.get("REMOTE_ADDR"),
+                    user_agent=request.META.get("HTTP_USER_AGENT", "")[:512],
+                    referrer=request.META.get("HTTP_REFERER", "")[:512],
+                )
             )
         except Exception:
             pass
         return None
+
+
+class SlidingSessionMiddleware(MiddlewareMixin):
+    """
+    Sliding idle timeout without rewriting the session on every request:
+    the session is marked modified at most once per SESSION_TOUCH_INTERVAL.
+    Must sit after SessionMiddleware so this runs before the session is saved.
+    """
+
+    touch_interval = getattr(settings, "SESSION_TOUCH_INTERVAL", 60)
+
+    def process_response(self, request, response):
+        session = getattr(request, "session", None)
+        if session is None or session.is_empty():
+            return response
+        now = int(time.time())
+        if now - session.get("_last_touch", 0) >= self.touch_interval:
+            session["_last_touch"] = now
+        return response
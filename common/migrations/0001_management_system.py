@@ -25,11 +25,16 @@ def seed_management_systems(apps, schema_editor):
             "description": "Toggle project/job dashboards and related features.",
         },
     ]
-    for data in defaults:
-        ManagementSystem.objects.get_or_create(
-            key=data["key"],
-            defaults=data,
-        )
+    existing = set(
+        ManagementSystem.objects.filter(
+            key__in=[data["key"] for data in defaults]
+        ).values_list("key", flat=True)
+    )
+    ManagementSystem.objects.bulk_create(
+        [ManagementSystem(**data) for data in defaults if data["key"] not in existing],
+        batch_size=100,
+        ignore_conflicts=True,
+    )
 
 
 def remove_management_systems(apps, schema_editor):
@@ -41,7 +46,7 @@ def remove_management_systems(apps, schema_editor):
             "user_management",
             "website_content",
         ]
-    ).delete()
+    )._raw_delete(schema_editor.connection.alias)
 
 
 class Migration(migrations.Migration):
@@ -67,5 +72,5 @@ class Migration(migrations.Migration):
                 "ordering": ("name",),
             },
         ),
-        migrations.RunPython(seed_management_systems, remove_management_systems),
+        migrations.RunPython(seed_management_systems, remove_management_systems, elidable=True),
     ]
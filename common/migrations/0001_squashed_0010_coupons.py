@@ -0,0 +1,246 @@
+from django.conf import settings
+from django.core.validators import MinValueValidator
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+MANAGEMENT_SYSTEMS = [
+    {
+        "key": "signup_login",
+        "name": "Signup & Login Management",
+        "description": "Control whether users can sign up or log in to the portal.",
+    },
+    {
+        "key": "profile_management",
+        "name": "Profile Management",
+        "description": "Enable profile pages and profile update workflows.",
+    },
+    {
+        "key": "user_management",
+        "name": "User Management",
+        "description": "Allow moderation of pending users and approvals.",
+    },
+    {
+        "key": "website_content",
+        "name": "Website Content Management",
+        "description": "Toggle project/job dashboards and related features.",
+    },
+    {
+        "key": "ticket_management",
+        "name": "Ticket Management",
+        "description": "Toggle ticket creation and admin resolution panels.",
+    },
+    {
+        "key": "form_management",
+        "name": "Form Management",
+        "description": "Toggle marketing job drop and other form submissions.",
+    },
+    {
+        "key": "holiday_management",
+        "name": "Holiday Management",
+        "description": "Control holiday calendar to block deadlines.",
+    },
+]
+
+
+def seed_management_systems(apps, schema_editor):
+    ManagementSystem = apps.get_model("common", "ManagementSystem")
+    existing = set(
+        ManagementSystem.objects.filter(
+            key__in=[data["key"] for data in MANAGEMENT_SYSTEMS]
+        ).values_list("key", flat=True)
+    )
+    ManagementSystem.objects.bulk_create(
+        [ManagementSystem(**data) for data in MANAGEMENT_SYSTEMS if data["key"] not in existing],
+        batch_size=100,
+        ignore_conflicts=True,
+    )
+
+
+def remove_management_systems(apps, schema_editor):
+    ManagementSystem = apps.get_model("common", "ManagementSystem")
+    # nothing references these rows, so skip the deletion collector's SELECT
+    ManagementSystem.objects.filter(
+        key__in=[data["key"] for data in MANAGEMENT_SYSTEMS]
+    )._raw_delete(schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    replaces = [
+        ("common", "0001_management_system"),
+        ("common", "0002_add_ticket_system"),
+        ("common", "0002_gemcostrule"),
+        ("common", "0003_auto_20251119_1816"),
+        ("common", "0004_form_holiday_systems"),
+        ("common", "0005_notice_activitylog"),
+        ("common", "0006_errorlog"),
+        ("common", "0007_activitylogarchive_errorlogarchive"),
+        ("common", "0008_notice_audience"),
+        ("common", "0009_merge_gemcost_notice"),
+        ("common", "0010_coupons"),
+    ]
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ManagementSystem",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("key", models.CharField(choices=[("signup_login", "Signup & Login Management"), ("profile_management", "Profile Management"), ("user_management", "User Management"), ("website_content", "Website Content Management"), ("ticket_management", "Ticket Management"), ("form_management", "Form Management"), ("holiday_management", "Holiday Management")], max_length=64, unique=True)),
+                ("name", models.CharField(max_length=128)),
+                ("description", models.TextField(blank=True)),
+                ("enabled_for_accounts", models.BooleanField(default=True)),
+                ("enabled_for_marketing", models.BooleanField(default=True)),
+                ("enabled_for_superadmins", models.BooleanField(default=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ("name",),
+            },
+        ),
+        migrations.RunPython(seed_management_systems, remove_management_systems),
+        migrations.CreateModel(
+            name="GemCostRule",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("key", models.CharField(choices=[("summary", "Summary generation"), ("structure", "Structure generation"), ("content", "Content generation (per 200 words)"), ("monster", "Monster generation")], max_length=32, unique=True)),
+                ("cost", models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={"ordering": ("key",)},
+        ),
+        migrations.CreateModel(
+            name="Notice",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("title", models.CharField(max_length=255)),
+                ("message", models.TextField()),
+                ("start_at", models.DateTimeField(blank=True, null=True)),
+                ("end_at", models.DateTimeField(blank=True, null=True)),
+                ("is_active", models.BooleanField(default=True)),
+                ("show_on_marketing", models.BooleanField(default=True)),
+                ("show_on_global", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("created_by", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="notices_created", to=settings.AUTH_USER_MODEL)),
+                ("updated_by", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="notices_updated", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={"ordering": ("-created_at",)},
+        ),
+        migrations.CreateModel(
+            name="ActivityLog",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("path", models.CharField(max_length=512)),
+                ("method", models.CharField(max_length=10)),
+                ("status_code", models.PositiveIntegerField()),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                ("user_agent", models.CharField(blank=True, max_length=512)),
+                ("referrer", models.CharField(blank=True, max_length=512)),
+                ("duration_ms", models.FloatField(default=0)),
+                ("action_type", models.CharField(blank=True, max_length=64)),
+                ("extra_meta", models.JSONField(blank=True, default=dict)),
+                ("session_key", models.CharField(blank=True, max_length=64)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("user", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="activity_logs", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={"ordering": ("-created_at",)},
+        ),
+        migrations.CreateModel(
+            name="ErrorLog",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("path", models.CharField(max_length=512)),
+                ("method", models.CharField(max_length=10)),
+                ("status_code", models.PositiveIntegerField(default=500)),
+                ("message", models.TextField(blank=True)),
+                ("traceback", models.TextField(blank=True)),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                ("user_agent", models.CharField(blank=True, max_length=512)),
+                ("referrer", models.CharField(blank=True, max_length=512)),
+                ("resolved", models.BooleanField(default=False)),
+                ("resolved_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("resolved_by", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="resolved_error_logs", to=settings.AUTH_USER_MODEL)),
+                ("user", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="error_logs", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={"ordering": ("-created_at",)},
+        ),
+        migrations.CreateModel(
+            name="ActivityLogArchive",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("path", models.CharField(max_length=512)),
+                ("method", models.CharField(max_length=10)),
+                ("status_code", models.PositiveIntegerField()),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                ("user_agent", models.CharField(blank=True, max_length=512)),
+                ("referrer", models.CharField(blank=True, max_length=512)),
+                ("duration_ms", models.FloatField(default=0)),
+                ("action_type", models.CharField(blank=True, max_length=64)),
+                ("extra_meta", models.JSONField(blank=True, default=dict)),
+                ("session_key", models.CharField(blank=True, max_length=64)),
+                ("created_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                ("user", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="activity_logs_archived", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={"ordering": ("-archived_at",)},
+        ),
+        migrations.CreateModel(
+            name="ErrorLogArchive",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("path", models.CharField(max_length=512)),
+                ("method", models.CharField(max_length=10)),
+                ("status_code", models.PositiveIntegerField(default=500)),
+                ("message", models.TextField(blank=True)),
+                ("traceback", models.TextField(blank=True)),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                ("user_agent", models.CharField(blank=True, max_length=512)),
+                ("referrer", models.CharField(blank=True, max_length=512)),
+                ("resolved", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                ("user", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="error_logs_archived", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={"ordering": ("-archived_at",)},
+        ),
+        migrations.CreateModel(
+            name="Coupon",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("code", models.CharField(max_length=64, unique=True)),
+                ("description", models.TextField(blank=True)),
+                ("discount_type", models.CharField(choices=[("fixed", "Fixed gems off"), ("percent", "Percent off")], default="fixed", max_length=16)),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=10, validators=[MinValueValidator(0)])),
+                ("max_uses_per_user", models.PositiveIntegerField(default=1)),
+                ("valid_from", models.DateTimeField()),
+                ("valid_to", models.DateTimeField()),
+                ("is_active", models.BooleanField(default=True)),
+                ("applies_to_all", models.BooleanField(default=True)),
+                ("applicable_tasks", models.JSONField(blank=True, default=list)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("assigned_users", models.ManyToManyField(blank=True, related_name="assigned_coupons", to=settings.AUTH_USER_MODEL)),
+                ("created_by", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="coupons_created", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={"ordering": ("-valid_to", "code")},
+        ),
+        migrations.CreateModel(
+            name="CouponRedemption",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("task_type", models.CharField(max_length=32)),
+                ("gems_discounted", models.DecimalField(decimal_places=2, max_digits=10, validators=[MinValueValidator(0)])),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("coupon", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="redemptions", to="common.coupon")),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="coupon_redemptions", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={"ordering": ("-created_at",)},
+        ),
+    ]
@@ -3,21 +3,26 @@ from django.db import migrations
 
 def add_ticket_system(apps, schema_editor):
     ManagementSystem = apps.get_model("common", "ManagementSystem")
-    ManagementSystem.objects.get_or_create(
-        key="ticket_management",
-        defaults={
-            "name": "Ticket Management",
-            "description": "Toggle ticket creation and admin resolution panels.",
-            "enabled_for_accounts": True,
-            "enabled_for_marketing": True,
-            "enabled_for_superadmins": True,
-        },
+    if ManagementSystem.objects.filter(key="ticket_management").exists():
+        return
+    ManagementSystem.objects.bulk_create(
+        [
+            ManagementSystem(
+                key="ticket_management",
+                name="Ticket Management",
+                description="Toggle ticket creation and admin resolution panels.",
+                enabled_for_accounts=True,
+                enabled_for_marketing=True,
+                enabled_for_superadmins=True,
+            )
+        ],
+        ignore_conflicts=True,
     )
 
 
 def remove_ticket_system(apps, schema_editor):
     ManagementSystem = apps.get_model("common", "ManagementSystem")
-    ManagementSystem.objects.filter(key="ticket_management").delete()
+    ManagementSystem.objects.filter(key="ticket_management")._raw_delete(schema_editor.connection.alias)
 
 
 class Migration(migrations.Migration):
@@ -27,5 +32,5 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
-        migrations.RunPython(add_ticket_system, remove_ticket_system),
+        migrations.RunPython(add_ticket_system, remove_ticket_system, elidable=True),
     ]
@@ -15,18 +15,23 @@ def add_form_holiday_systems(apps, schema_editor):
             "description": "Control holiday calendar to block deadlines.",
         },
     ]
-    for data in defaults:
-        ManagementSystem.objects.get_or_create(
-            key=data["key"],
-            defaults=data,
-        )
+    existing = set(
+        ManagementSystem.objects.filter(
+            key__in=[data["key"] for data in defaults]
+        ).values_list("key", flat=True)
+    )
+    ManagementSystem.objects.bulk_create(
+        [ManagementSystem(**data) for data in defaults if data["key"] not in existing],
+        batch_size=100,
+        ignore_conflicts=True,
+    )
 
 
 def remove_form_holiday_systems(apps, schema_editor):
     ManagementSystem = apps.get_model("common", "ManagementSystem")
     ManagementSystem.objects.filter(
         key__in=["form_management", "holiday_management"]
-    ).delete()
+    )._raw_delete(schema_editor.connection.alias)
 
 
 class Migration(migrations.Migration):
@@ -53,5 +58,5 @@ class Migration(migrations.Migration):
                 unique=True,
             ),
         ),
-        migrations.RunPython(add_form_holiday_systems, remove_form_holiday_systems),
+        migrations.RunPython(add_form_holiday_systems, remove_form_holiday_systems, elidable=True),
     ]
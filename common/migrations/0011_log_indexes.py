@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_squashed_0010_coupons"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(fields=["-created_at"], name="actlog_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(fields=["user", "-created_at"], name="actlog_user_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(fields=["action_type", "-created_at"], name="actlog_action_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="errorlog",
+            index=models.Index(fields=["-created_at"], name="errlog_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="errorlog",
+            index=models.Index(fields=["resolved", "-created_at"], name="errlog_resolved_created_idx"),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0011_log_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="coupon",
+            index=models.Index(fields=["is_active", "valid_to", "valid_from"], name="coupon_active_window_idx"),
+        ),
+    ]
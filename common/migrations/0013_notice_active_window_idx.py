@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0012_coupon_active_window_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notice",
+            index=models.Index(fields=["is_active", "end_at", "start_at"], name="notice_active_window_idx"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0013_notice_active_window_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="coupon",
+            index=models.Index(fields=["-valid_to", "code"], name="coupon_ordering_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="notice",
+            index=models.Index(fields=["-created_at"], name="notice_created_idx"),
+        ),
+    ]
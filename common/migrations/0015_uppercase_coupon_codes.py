@@ -0,0 +1,49 @@
+import logging
+
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+CODE_MAX_LENGTH = 64
+
+
+def _free_code(code, taken):
+    """``code`` with the first -N suffix that is not taken, kept within the column."""
+    n = 2
+    while True:
+        suffix = f"-{n}"
+        candidate = f"{code[:CODE_MAX_LENGTH - len(suffix)]}{suffix}"
+        if candidate not in taken:
+            return candidate
+        n += 1
+
+
+def uppercase_coupon_codes(apps, schema_editor):
+    Coupon = apps.get_model("common", "Coupon")
+    taken = set(Coupon.objects.values_list("code", flat=True))
+    renamed = []
+    for coupon in Coupon.objects.only("id", "code").order_by("pk"):
+        code = coupon.code.strip().upper()
+        if code == coupon.code:
+            continue
+        # Redemption matches the uppercased input exactly, so a case-only
+        # duplicate left as-is could never be redeemed; suffix it instead.
+        if code in taken:
+            new_code = _free_code(code, taken)
+            renamed.append((coupon.code, new_code))
+            code = new_code
+        Coupon.objects.filter(pk=coupon.pk).update(code=code)
+        taken.add(code)
+    for old, new in renamed:
+        logger.warning("Renamed coupon code %r to %r; it clashed once uppercased", old, new)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0014_coupon_notice_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(uppercase_coupon_codes, migrations.RunPython.noop),
+    ]
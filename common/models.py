@@ -3,6 +3,17 @@ from django.conf import settings
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from accounts.models import User
+
+# Notice audience per role; staff see everything, unknown roles get the marketing set.
+_AUDIENCE_Q = {
+    User.Role.MARKETING: models.Q(show_on_marketing=True),
+    User.Role.GLOBAL: models.Q(show_on_global=True),
+    User.Role.SUPER_ADMIN: models.Q(),
+    User.Role.CO_SUPER_ADMIN: models.Q(),
+}
+_DEFAULT_AUDIENCE_Q = models.Q(show_on_marketing=True)
+
 
 class ManagementSystem(models.Model):
     """Configurable management systems controlled by Super Admins."""
@@ -31,6 +42,32 @@ class ManagementSystem(models.Model):
         return self.name
 
 
+class NoticeQuerySet(models.QuerySet):
+    def active_for_user(self, user):
+        """Active notices inside their window for the user's audience."""
+        now = timezone.now()
+        return (
+            self.filter(is_active=True)
+            .filter(Notice._audience_filter(user))
+            .filter(
+                models.Q(start_at__lte=now) | models.Q(start_at__isnull=True),
+                models.Q(end_at__gte=now) | models.Q(end_at__isnull=True),
+            )
+            .only(
+                "id",
+                "title",
+                "message",
+                "start_at",
+                "end_at",
+                "is_active",
+                "show_on_marketing",
+                "show_on_global",
+                "created_at",
+            )
+            .order_by("-created_at")
+        )
+
+
 class Notice(models.Model):
     """System-wide notice banner."""
 
@@ -58,12 +95,51 @@ class Notice(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = NoticeQuerySet.as_manager()
+
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["is_active", "end_at", "start_at"], name="notice_active_window_idx"),
+            models.Index(fields=["-created_at"], name="notice_created_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def _audience_filter(cls, user):
+        """Return the audience filter for the current user's role."""
+        return _AUDIENCE_Q.get(getattr(user, "role", None), _DEFAULT_AUDIENCE_Q)
+
+    @classmethod
+    def active_for_user(cls, user):
+        """Return active notices filtered for the user's audience."""
+        return cls.objects.active_for_user(user)
+
+    @property
+    def is_current(self):
+        now = timezone.now()
+        if not self.is_active:
+            return False
+        if self.start_at and now < self.start_at:
+            return False
+        if self.end_at and now > self.end_at:
+            return False
+        return True
+
+
+class CouponQuerySet(models.QuerySet):
+    def currently_valid(self, user):
+        """Active coupons inside their window that apply to ``user``."""
+        now = timezone.now()
+        return self.filter(
+            is_active=True, valid_from__lte=now, valid_to__gte=now
+        ).filter(
+            models.Q(applies_to_all=True)
+            | models.Q(pk__in=self.model.assigned_ids_for_user(user))
+        )
+
 
 class Coupon(models.Model):
     """Coupons that reduce gem costs for global user tasks."""
@@ -99,13 +175,41 @@ class Coupon(models.Model):
     )
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CouponQuerySet.as_manager()
+
     class Meta:
         ordering = ("-valid_to", "code")
+        indexes = [
+            models.Index(fields=["is_active", "valid_to", "valid_from"], name="coupon_active_window_idx"),
+            models.Index(fields=["-valid_to", "code"], name="coupon_ordering_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Stored uppercase so redemption lookups can use the unique index with an exact match.
+        if self.code:
+            self.code = self.code.strip().upper()
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.code
 
-    def is_valid_for_user(self, user):
+    @classmethod
+    def assigned_ids_for_user(cls, user):
+        """Return the ids of coupons assigned to the user, in one query."""
+        user_id = getattr(user, "pk", None)
+        if user_id is None:
+            return set()
+        return set(
+            cls.assigned_users.through.objects.filter(user_id=user_id).values_list(
+                "coupon_id", flat=True
+            )
+        )
+
+    def is_valid_for_user(self, user, assigned_ids=None):
+        """
+        Check the window and audience for this coupon. Pass ``assigned_ids``
+        (from ``assigned_ids_for_user``) when validating many coupons.
+        """
         if not self.is_active:
             return False
         now = timezone.now()
@@ -115,6 +219,8 @@ class Coupon(models.Model):
             return False
         if self.applies_to_all:
             return True
+        if assigned_ids is not None:
+            return self.pk in assigned_ids
         return self.assigned_users.filter(pk=getattr(user, "pk", None)).exists()
 
 
@@ -130,50 +236,6 @@ class CouponRedemption(models.Model):
     class Meta:
         ordering = ("-created_at",)
 
-    @classmethod
-    def _audience_filter(cls, user):
-        """Build an audience filter based on the current user's role."""
-        try:
-            role = getattr(user, "role", None)
-            Role = getattr(user, "Role", None)
-            if Role and role == Role.MARKETING:
-                return models.Q(show_on_marketing=True)
-            if Role and role == Role.GLOBAL:
-                return models.Q(show_on_global=True)
-            if Role and role in {Role.SUPER_ADMIN, Role.CO_SUPER_ADMIN}:
-                return models.Q()
-        except Exception:
-            pass
-        return models.Q(show_on_marketing=True)
-
-    @classmethod
-    def active_for_user(cls, user):
-        """Return active notices filtered for the user's audience."""
-        now = timezone.now()
-        audience_filter = cls._audience_filter(user)
-        return (
-            cls.objects.filter(is_active=True)
-            .filter(audience_filter)
-            .filter(
-                models.Q(start_at__lte=now) | models.Q(start_at__isnull=True),
-                models.Q(end_at__gte=now) | models.Q(end_at__isnull=True),
-            )
-            .order_by("-created_at")
-        )
-
-    @property
-    def is_current(self):
-        from django.utils import timezone
-
-        now = timezone.now()
-        if not self.is_active:
-            return False
-        if self.start_at and now < self.start_at:
-            return False
-        if self.end_at and now > self.end_at:
-            return False
-        return True
-
 
 class ActivityLog(models.Model):
     """Audit log of user actions and requests."""
@@ -199,6 +261,11 @@ class ActivityLog(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["-created_at"], name="actlog_created_idx"),
+            models.Index(fields=["user", "-created_at"], name="actlog_user_created_idx"),
+            models.Index(fields=["action_type", "-created_at"], name="actlog_action_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} {self.method} {self.path} [{self.status_code}]"
@@ -235,6 +302,10 @@ class ErrorLog(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["-created_at"], name="errlog_created_idx"),
+            models.Index(fields=["resolved", "-created_at"], name="errlog_resolved_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.status_code} {self.path}"
@@ -0,0 +1,65 @@
+"""Cached lookups for the notice banners shown on every page."""
+
+import logging
+
+from django.core.cache import cache
+
+from .models import Notice
+
+logger = logging.getLogger(__name__)
+
+NOTICES_CACHE_TTL = 60  # seconds; also bounds how late a notice window opens/closes
+NOTICES_VERSION_KEY = "notices:version"
+# Bumped when the snapshot row format changes; rows hold aware datetimes only.
+FALLBACK_NOTICES_KEY = "fallback_notices:v2"
+NOTICE_FIELDS = (
+    "id",
+    "title",
+    "message",
+    "start_at",
+    "end_at",
+    "is_active",
+    "show_on_marketing",
+    "show_on_global",
+)
+
+
+def invalidate_notices():
+    """
+    Expire every cached notice list and rebuild the fallback snapshot;
+    called from Notice save/delete signals.
+    """
+    try:
+        cache.incr(NOTICES_VERSION_KEY)
+    except ValueError:
+        cache.set(NOTICES_VERSION_KEY, 1, None)
+    try:
+        refresh_fallback_notices()
+    except Exception:
+        # The write that fired the signal already succeeded; keep the old snapshot.
+        logger.exception("Could not refresh the fallback notice snapshot")
+
+
+def refresh_fallback_notices():
+    """
+    Store an unfiltered snapshot of every notice for pages to fall back on
+    when the database is unavailable, and return it.
+    """
+    snapshot = list(Notice.objects.values(*NOTICE_FIELDS))
+    cache.set(FALLBACK_NOTICES_KEY, snapshot, None)
+    return snapshot
+
+
+def active_notices_for(user):
+    """
+    Active notices for the user's audience as plain dicts, cached per role.
+    Templates read them with the same dotted lookups as Notice instances.
+    """
+    version = cache.get_or_set(NOTICES_VERSION_KEY, 1, None)
+    role = getattr(user, "role", None) or "anonymous"
+    cache_key = f"notices:{version}:{role}"
+    notices = cache.get(cache_key)
+    if notices is None:
+        notices = list(Notice.objects.active_for_user(user).values(*NOTICE_FIELDS))
+        cache.set(cache_key, notices, NOTICES_CACHE_TTL)
+    return notices
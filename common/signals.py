@@ -0,0 +1,84 @@
+"""Signal handlers keeping cached nav badges, system toggles, notices, form schemas and holidays fresh."""
+
+from django.db.models.signals import post_delete, post_init, post_save
+
+from accounts.models import FloorSignupRequest, ProfileUpdateRequest, User
+from formbuilder.models import FormDefinition, FormField
+from formbuilder.utils import invalidate_form_schemas
+from jobs.models import Holiday, Job, invalidate_holiday_dates
+
+from .context_processors import invalidate_nav_counts
+from .models import ManagementSystem, Notice
+from .notices import invalidate_notices
+from .system_control import invalidate_systems
+
+
+def _invalidate_nav_counts(sender, **kwargs):
+    invalidate_nav_counts()
+
+
+for _model in (Job, ProfileUpdateRequest, FloorSignupRequest):
+    post_save.connect(_invalidate_nav_counts, sender=_model, dispatch_uid=f"navcounts_save_{_model.__name__}")
+    post_delete.connect(_invalidate_nav_counts, sender=_model, dispatch_uid=f"navcounts_delete_{_model.__name__}")
+post_delete.connect(_invalidate_nav_counts, sender=User, dispatch_uid="navcounts_delete_User")
+
+# The only User fields the badge totals depend on. Logins save the user
+# (last_login, SSO metadata), and those saves must not clear the shared cache.
+_USER_BADGE_FIELDS = ("role", "is_active", "is_account_approved")
+_UNKNOWN = object()
+
+
+def _user_badge_state(user):
+    # Deferred fields are missing from __dict__ and count as unknown.
+    return tuple(user.__dict__.get(field, _UNKNOWN) for field in _USER_BADGE_FIELDS)
+
+
+def _remember_user_badge_state(sender, instance, **kwargs):
+    instance._badge_state = _user_badge_state(instance)
+
+
+def _invalidate_nav_counts_for_user(sender, instance, created=False, update_fields=None, **kwargs):
+    if update_fields is not None and not set(_USER_BADGE_FIELDS).intersection(update_fields):
+        return
+    previous = getattr(instance, "_badge_state", None)
+    instance._badge_state = _user_badge_state(instance)
+    if not created and previous is not None and _UNKNOWN not in previous and previous == instance._badge_state:
+        return
+    invalidate_nav_counts()
+
+
+post_init.connect(_remember_user_badge_state, sender=User, dispatch_uid="navcounts_init_User")
+post_save.connect(_invalidate_nav_counts_for_user, sender=User, dispatch_uid="navcounts_save_User")
+
+
+def _invalidate_systems(sender, **kwargs):
+    invalidate_systems()
+
+
+post_save.connect(_invalidate_systems, sender=ManagementSystem, dispatch_uid="mgmt_systems_save")
+post_delete.connect(_invalidate_systems, sender=ManagementSystem, dispatch_uid="mgmt_systems_delete")
+
+
+def _invalidate_notices(sender, **kwargs):
+    invalidate_notices()
+
+
+post_save.connect(_invalidate_notices, sender=Notice, dispatch_uid="notices_save")
+post_delete.connect(_invalidate_notices, sender=Notice, dispatch_uid="notices_delete")
+
+
+def _invalidate_form_schemas(sender, **kwargs):
+    invalidate_form_schemas()
+
+
+for _model in (FormDefinition, FormField):
+    post_save.connect(_invalidate_form_schemas, sender=_model, dispatch_uid=f"formfields_save_{_model.__name__}")
+    post_delete.connect(_invalidate_form_schemas, sender=_model, dispatch_uid=f"formfields_delete_{_model.__name__}")
+
+
+def _invalidate_holiday_dates(sender, **kwargs):
+    invalidate_holiday_dates()
+
+
+post_save.connect(_invalidate_holiday_dates, sender=Holiday, dispatch_uid="holiday_dates_save")
+post_delete.connect(_invalidate_holiday_dates, sender=Holiday, dispatch_uid="holiday_dates_delete")
@@ -1,6 +1,6 @@
 """Helpers to query management system configuration."""
 
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.cache import cache
 
 from accounts.models import User
 from .models import ManagementSystem
@@ -12,6 +12,12 @@ ROLE_FIELD_MAP = {
     User.Role.CO_SUPER_ADMIN: "enabled_for_superadmins",
 }
 
+# Key/label pairs never change at runtime, so resolve the choices once.
+_SYSTEM_CHOICES = tuple(ManagementSystem.Keys.choices)
+
+SYSTEMS_CACHE_KEY = "mgmt_systems_v1"
+SYSTEMS_CACHE_TTL = 60  # seconds; saves invalidate it, the TTL covers other processes
+
 
 def _field_for_user(user):
     if user and getattr(user, "is_authenticated", False):
@@ -19,14 +25,39 @@ def _field_for_user(user):
     return ROLE_FIELD_MAP["anonymous"]
 
 
+def _load_systems():
+    return {
+        row["key"]: row
+        for row in ManagementSystem.objects.values(
+            "key",
+            "name",
+            "description",
+            "enabled_for_accounts",
+            "enabled_for_marketing",
+            "enabled_for_superadmins",
+        )
+    }
+
+
+def get_systems():
+    """Return every configured system keyed by ``key``, from one cached query."""
+
+    return cache.get_or_set(SYSTEMS_CACHE_KEY, _load_systems, SYSTEMS_CACHE_TTL)
+
+
+def invalidate_systems():
+    """Drop the cached system rows; called from ManagementSystem save/delete signals."""
+
+    cache.delete(SYSTEMS_CACHE_KEY)
+
+
 def is_system_enabled(key, user=None):
     """Return True if the system is enabled for the provided user."""
 
-    try:
-        system = ManagementSystem.objects.get(key=key)
-    except ObjectDoesNotExist:
+    system = get_systems().get(key)
+    if system is None:
         return True
-    return getattr(system, _field_for_user(user))
+    return system[_field_for_user(user)]
 
 
 def get_management_system_map(user=None):
@@ -39,20 +70,19 @@ def get_management_system_map(user=None):
             "description": "",
             "enabled": True,
         }
-        for choice, label in ManagementSystem.Keys.choices
+        for choice, label in _SYSTEM_CHOICES
     }
-    systems = ManagementSystem.objects.all()
-    for system in systems:
-        data[system.key] = {
-            "name": system.name,
-            "description": system.description,
-            "enabled": getattr(system, field),
+    for key, system in get_systems().items():
+        data[key] = {
+            "name": system["name"],
+            "description": system["description"],
+            "enabled": system[field],
         }
     return data
 
 
 def get_system_name(key):
-    try:
-        return ManagementSystem.objects.get(key=key).name
-    except ObjectDoesNotExist:
+    system = get_systems().get(key)
+    if system is None:
         return "Requested feature"
+    return system["name"]
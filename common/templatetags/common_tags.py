@@ -5,13 +5,31 @@ from django.db import models
 from django.utils import timezone
 from django.core.cache import cache
 import re
-import datetime
+from functools import lru_cache
 from types import SimpleNamespace
 
 from common.utils import format_currency, localize_deadline
 
 register = template.Library()
 
+_EDGE_RE = re.compile(r"edg/([\d\.]+)")
+_OPERA_RE = re.compile(r"(?:opr|opera)/([\d\.]+)")
+_CHROME_RE = re.compile(r"chrome/([\d\.]+)")
+_SAFARI_RE = re.compile(r"version/([\d\.]+)")
+_FIREFOX_RE = re.compile(r"firefox/([\d\.]+)")
+_IE_RE = re.compile(r"(?:msie |rv:)([\d\.]+)")
+
+# (family, substring gate, version regex); order matters because Edge and
+# Opera UAs also carry the Chrome/Safari tokens.
+_BROWSER_RULES = (
+    ("Edge", lambda ua: "edg" in ua, _EDGE_RE),
+    ("Opera", lambda ua: "opr" in ua or "opera" in ua, _OPERA_RE),
+    ("Chrome", lambda ua: "chrome" in ua and "safari" in ua, _CHROME_RE),
+    ("Safari", lambda ua: "safari" in ua and "chrome" not in ua, _SAFARI_RE),
+    ("Firefox", lambda ua: "firefox" in ua, _FIREFOX_RE),
+    ("Internet Explorer", lambda ua: "msie" in ua or "trident" in ua, _IE_RE),
+)
+
 
 @register.filter
 def currency(value):
@@ -27,9 +45,12 @@ def deadline(value):
 def dict_get(value, key):
     """Fetch dict entry safely inside templates."""
 
-    if isinstance(value, dict):
-        return value.get(key)
-    return None
+    # dict.get raises TypeError for non-dicts; unlike a duck-typed .get this
+    # never calls QuerySet.get or other look-alike methods.
+    try:
+        return dict.get(value, key)
+    except TypeError:
+        return None
 
 
 @register.filter
@@ -37,78 +58,41 @@ def browser_name(user_agent):
     """Small UA parser to extract browser family + version."""
     if not user_agent:
         return "Unknown"
-    ua = str(user_agent).lower()
-    def match(pattern):
-        m = re.search(pattern, ua)
-        return m.group(1) if m else ""
-
-    if "edg" in ua:
-        ver = match(r"edg/([\d\.]+)")
-        return f"Edge {ver}" if ver else "Edge"
-    if "opr" in ua or "opera" in ua:
-        ver = match(r"(?:opr|opera)/([\d\.]+)")
-        return f"Opera {ver}" if ver else "Opera"
-    if "chrome" in ua and "safari" in ua:
-        ver = match(r"chrome/([\d\.]+)")
-        return f"Chrome {ver}" if ver else "Chrome"
-    if "safari" in ua and "chrome" not in ua:
-        ver = match(r"version/([\d\.]+)")
-        return f"Safari {ver}" if ver else "Safari"
-    if "firefox" in ua:
-        ver = match(r"firefox/([\d\.]+)")
-        return f"Firefox {ver}" if ver else "Firefox"
-    if "msie" in ua or "trident" in ua:
-        ver = match(r"(?:msie |rv:)([\d\.]+)")
-        return f"Internet Explorer {ver}" if ver else "Internet Explorer"
+    return _parse_browser(str(user_agent))
+
+
+@lru_cache(maxsize=4096)
+def _parse_browser(user_agent):
+    # Log pages repeat the same handful of UA strings on every row.
+    ua = user_agent.lower()
+    for family, gate, regex in _BROWSER_RULES:
+        if gate(ua):
+            m = regex.search(ua)
+            return f"{family} {m.group(1)}" if m else family
     return user_agent
 
 
 @register.simple_tag
 def active_notices(user):
     """Return active notices (no user filtering)."""
-    from common.models import Notice
+    from common.notices import FALLBACK_NOTICES_KEY, active_notices_for
 
     try:
-        notices = list(Notice.active_for_user(user))
-        cache.set(
-            "fallback_notices",
-            list(
-                Notice.objects.values(
-                    "id",
-                    "title",
-                    "message",
-                    "start_at",
-                    "end_at",
-                    "is_active",
-                    "show_on_marketing",
-                    "show_on_global",
-                )
-            ),
-            None,
-        )
-        return notices
+        return active_notices_for(user)
     except Exception:
         # Fail safe if DB not migrated or backend errors
-        cached = cache.get("fallback_notices", [])
+        cached = cache.get(FALLBACK_NOTICES_KEY, [])
         results = []
         now = timezone.now()
         for n in cached:
             # Apply the same active window logic
             if not n.get("is_active"):
                 continue
+            # snapshot rows come from .values(), so these are aware datetimes
             start_at = n.get("start_at")
             end_at = n.get("end_at")
             show_on_marketing = n.get("show_on_marketing", True)
             show_on_global = n.get("show_on_global", True)
-            try:
-                # cache stores datetimes already, but guard if strings
-                if isinstance(start_at, str):
-                    start_at = timezone.make_aware(datetime.datetime.fromisoformat(start_at))
-                if isinstance(end_at, str):
-                    end_at = timezone.make_aware(datetime.datetime.fromisoformat(end_at))
-            except Exception:
-                start_at = n.get("start_at")
-                end_at = n.get("end_at")
             if start_at and now < start_at:
                 continue
             if end_at and now > end_at:
@@ -1,17 +1,21 @@
 """Utility helpers shared across apps."""
 
+from collections import deque
 from decimal import Decimal
 
-from bson.decimal128 import Decimal128
 from django.utils import timezone
 
+VISITED_JOBS_SESSION_KEY = "visited_job_ids"
+VISITED_JOBS_LIMIT = 500
+
 
 def to_decimal(value):
     """Convert Mongo Decimal128 or other numeric values to Decimal."""
 
     if value is None:
         return Decimal("0")
-    if isinstance(value, Decimal128):
+    if type(value).__name__ == "Decimal128" and hasattr(value, "to_decimal"):
+        # bson's Decimal128, matched by name so this module does not import bson
         value = value.to_decimal()
     try:
         return Decimal(value)
@@ -22,7 +26,11 @@ def to_decimal(value):
 def format_currency(amount):
     """Return a neatly formatted INR string."""
 
-    return f"₹{to_decimal(amount):,.2f}"
+    # Decimal/int/float format exactly as their Decimal conversion would, so
+    # the common model-field types skip the Decimal128 check and try/except.
+    if not isinstance(amount, (Decimal, int, float)):
+        amount = to_decimal(amount)
+    return f"₹{amount:,.2f}"
 
 
 def localize_deadline(value):
@@ -33,3 +41,20 @@ def localize_deadline(value):
     if timezone.is_naive(value):
         value = timezone.make_aware(value, timezone.get_current_timezone())
     return timezone.localtime(value).strftime("%d %b %Y %I:%M %p")
+
+
+def recent_visited_job_ids(session):
+    """Return the most recently visited job ids stored in the session."""
+
+    return session.get(VISITED_JOBS_SESSION_KEY, [])[-VISITED_JOBS_LIMIT:]
+
+
+def remember_visited_job(session, job_id):
+    """Record a job visit, keeping only the latest VISITED_JOBS_LIMIT ids."""
+
+    visited = recent_visited_job_ids(session)
+    if job_id in visited:
+        return
+    visited = deque(visited, maxlen=VISITED_JOBS_LIMIT)
+    visited.append(job_id)
+    session[VISITED_JOBS_SESSION_KEY] = list(visited)
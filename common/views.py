@@ -1,11 +1,19 @@
+from collections import deque
+
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.views.decorators.http import require_POST
 from django.utils import timezone
 
+from accounts.models import User
 from common.models import Notice
 
+DISMISSED_NOTICES_SESSION_KEY = "dismissed_notice_ids"
+DISMISSED_NOTICES_LIMIT = 200
+
+_ADMIN_ROLES = frozenset((User.Role.SUPER_ADMIN, User.Role.CO_SUPER_ADMIN))
+
 
 @login_required
 @require_POST
@@ -15,23 +23,22 @@ def dismiss_notice(request):
         notice_id = int(notice_id)
     except (TypeError, ValueError):
         return JsonResponse({"ok": False})
-    dismissed = request.session.get("dismissed_notice_ids", [])
+    dismissed = request.session.get(DISMISSED_NOTICES_SESSION_KEY, [])
     if notice_id not in dismissed:
+        # keep only the latest dismissals so the session payload stays bounded
+        dismissed = deque(dismissed, maxlen=DISMISSED_NOTICES_LIMIT)
         dismissed.append(notice_id)
-        request.session["dismissed_notice_ids"] = dismissed
+        request.session[DISMISSED_NOTICES_SESSION_KEY] = list(dismissed)
     return JsonResponse({"ok": True})
 
 
 def root_redirect(request):
     user = request.user
     if user.is_authenticated:
+        # Role members are str subclasses, so they match raw role strings too.
         role = getattr(user, "role", None)
-        try:
-            Role = user.Role
-        except Exception:
-            Role = None
-        if role in {"super_admin", "co_super_admin"} or (Role and role in {Role.SUPER_ADMIN, Role.CO_SUPER_ADMIN}):
+        if role in _ADMIN_ROLES:
             return redirect("superadmin:welcome")
-        if role == "marketing" or (Role and role == Role.MARKETING):
+        if role == User.Role.MARKETING:
             return redirect("marketing:welcome")
     return redirect("accounts:login")
@@ -1,103 +1,242 @@
 from django.db import migrations
 
+JOB_FIELDS = (
+    {
+        "name": "job_id_customer",
+        "label": "Job ID (From Customer)",
+        "field_type": "text",
+        "order": 1,
+        "required_roles": ["marketing"],
+        "visible_roles": ["marketing"],
+        "read_only_roles": [],
+        "target_field": "job_id_customer",
+        "is_system": False,
+    },
+    {
+        "name": "instruction",
+        "label": "Instruction",
+        "field_type": "textarea",
+        "order": 2,
+        "required_roles": ["marketing"],
+        "visible_roles": ["marketing"],
+        "read_only_roles": [],
+        "target_field": "instruction",
+        "is_system": False,
+    },
+    {
+        "name": "amount_inr",
+        "label": "Amount",
+        "field_type": "number",
+        "order": 3,
+        "required_roles": ["marketing"],
+        "visible_roles": ["marketing"],
+        "read_only_roles": [],
+        "target_field": "amount_inr",
+        "is_system": False,
+    },
+    {
+        "name": "expected_deadline",
+        "label": "Expected Deadline",
+        "field_type": "datetime",
+        "order": 4,
+        "required_roles": ["marketing"],
+        "visible_roles": ["marketing"],
+        "read_only_roles": [],
+        "target_field": "expected_deadline",
+        "is_system": False,
+    },
+    {
+        "name": "strict_deadline",
+        "label": "Strict Deadline",
+        "field_type": "datetime",
+        "order": 5,
+        "required_roles": ["marketing"],
+        "visible_roles": ["marketing"],
+        "read_only_roles": [],
+        "target_field": "strict_deadline",
+        "is_system": False,
+    },
+    {
+        "name": "attachments",
+        "label": "Attachments",
+        "field_type": "file",
+        "order": 6,
+        "required_roles": ["marketing"],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "attachments",
+        "is_system": True,
+    },
+)
 
-def seed_forms(apps, schema_editor):
-    FormDefinition = apps.get_model("formbuilder", "FormDefinition")
-    FormField = apps.get_model("formbuilder", "FormField")
+TICKET_FIELDS = (
+    {
+        "name": "subject",
+        "label": "Subject",
+        "field_type": "text",
+        "order": 1,
+        "required_roles": ["marketing"],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "subject",
+        "is_system": False,
+    },
+    {
+        "name": "description",
+        "label": "Description",
+        "field_type": "textarea",
+        "order": 2,
+        "required_roles": ["marketing"],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "description",
+        "is_system": False,
+    },
+    {
+        "name": "category",
+        "label": "Category",
+        "field_type": "select",
+        "order": 3,
+        "required_roles": ["marketing"],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "category",
+        "is_system": False,
+    },
+    {
+        "name": "job",
+        "label": "Related Job",
+        "field_type": "select",
+        "order": 4,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "job",
+        "is_system": False,
+    },
+    {
+        "name": "requested_expected_deadline",
+        "label": "Requested Expected",
+        "field_type": "datetime",
+        "order": 5,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "requested_expected_deadline",
+        "is_system": False,
+    },
+    {
+        "name": "requested_strict_deadline",
+        "label": "Requested Strict",
+        "field_type": "datetime",
+        "order": 6,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "requested_strict_deadline",
+        "is_system": False,
+    },
+)
 
-    jobs_def, _ = FormDefinition.objects.get_or_create(
-        slug="job_drop",
-        defaults={
+PROFILE_FIELDS = (
+    {
+        "name": "request_type",
+        "label": "Request Type",
+        "field_type": "select",
+        "order": 1,
+        "required_roles": ["marketing"],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "request_type",
+        "is_system": False,
+    },
+    {
+        "name": "updated_value",
+        "label": "Updated Value",
+        "field_type": "text",
+        "order": 2,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "updated_value",
+        "is_system": False,
+    },
+    {
+        "name": "file_upload",
+        "label": "File Upload",
+        "field_type": "file",
+        "order": 3,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "file_upload",
+        "is_system": False,
+    },
+    {
+        "name": "notes",
+        "label": "Notes",
+        "field_type": "textarea",
+        "order": 4,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "notes",
+        "is_system": False,
+    },
+)
+
+FORMS = (
+    (
+        "job_drop",
+        {
             "name": "Job Drop Form",
             "description": "Config for marketing job submissions.",
             "allowed_roles": ["marketing"],
         },
-    )
-    job_fields = [
-        ("job_id_customer", "Job ID (From Customer)", "text", 1, True, True, False),
-        ("instruction", "Instruction", "textarea", 2, True, True, False),
-        ("amount_inr", "Amount", "number", 3, True, True, False),
-        ("expected_deadline", "Expected Deadline", "datetime", 4, True, True, False),
-        ("strict_deadline", "Strict Deadline", "datetime", 5, True, True, False),
-        ("attachments", "Attachments", "file", 6, True, False, False),
-    ]
-    for name, label, ftype, order, required, visible, read_only in job_fields:
-        FormField.objects.get_or_create(
-            definition=jobs_def,
-            name=name,
-            defaults={
-                "label": label,
-                "field_type": ftype,
-                "order": order,
-                "required_roles": ["marketing"] if required else [],
-                "visible_roles": ["marketing"] if visible else [],
-                "read_only_roles": [],
-                "target_field": name,
-                "is_system": name in ("attachments",),
-            },
-        )
-
-    ticket_def, _ = FormDefinition.objects.get_or_create(
-        slug="ticket_create",
-        defaults={
+        JOB_FIELDS,
+    ),
+    (
+        "ticket_create",
+        {
             "name": "Ticket Form",
             "description": "Config for ticket submissions.",
             "allowed_roles": ["marketing", "super_admin", "co_super_admin"],
         },
-    )
-    ticket_fields = [
-        ("subject", "Subject", "text", 1, True, True, False),
-        ("description", "Description", "textarea", 2, True, True, False),
-        ("category", "Category", "select", 3, True, True, False),
-        ("job", "Related Job", "select", 4, False, True, False),
-        ("requested_expected_deadline", "Requested Expected", "datetime", 5, False, True, False),
-        ("requested_strict_deadline", "Requested Strict", "datetime", 6, False, True, False),
-    ]
-    for name, label, ftype, order, required, visible, read_only in ticket_fields:
-        FormField.objects.get_or_create(
-            definition=ticket_def,
-            name=name,
-            defaults={
-                "label": label,
-                "field_type": ftype,
-                "order": order,
-                "required_roles": ["marketing"] if required else [],
-                "visible_roles": [],
-                "read_only_roles": [],
-                "target_field": name,
-                "is_system": False,
-            },
-        )
-
-    profile_def, _ = FormDefinition.objects.get_or_create(
-        slug="profile_request",
-        defaults={
+        TICKET_FIELDS,
+    ),
+    (
+        "profile_request",
+        {
             "name": "Profile Update Request",
             "description": "Config for marketing profile update requests.",
             "allowed_roles": ["marketing"],
         },
-    )
-    profile_fields = [
-        ("request_type", "Request Type", "select", 1, True, True, False),
-        ("updated_value", "Updated Value", "text", 2, False, True, False),
-        ("file_upload", "File Upload", "file", 3, False, True, False),
-        ("notes", "Notes", "textarea", 4, False, True, False),
-    ]
-    for name, label, ftype, order, required, visible, read_only in profile_fields:
-        FormField.objects.get_or_create(
-            definition=profile_def,
-            name=name,
-            defaults={
-                "label": label,
-                "field_type": ftype,
-                "order": order,
-                "required_roles": ["marketing"] if required else [],
-                "visible_roles": [],
-                "read_only_roles": [],
-                "target_field": name,
-                "is_system": False,
-            },
+        PROFILE_FIELDS,
+    ),
+)
+
+
+def seed_forms(apps, schema_editor):
+    FormDefinition = apps.get_model("formbuilder", "FormDefinition")
+    FormField = apps.get_model("formbuilder", "FormField")
+
+    definitions = []
+    fields = []
+    for slug, defaults, rows in FORMS:
+        definition, _ = FormDefinition.objects.get_or_create(slug=slug, defaults=defaults)
+        definitions.append(definition)
+        fields += [FormField(definition=definition, **row) for row in rows]
+
+    existing = set(
+        FormField.objects.filter(definition__in=definitions).values_list(
+            "definition_id", "name"
         )
+    )
+    FormField.objects.bulk_create(
+        [f for f in fields if (f.definition_id, f.name) not in existing],
+        batch_size=100,
+        ignore_conflicts=True,
+    )
 
 
 class Migration(migrations.Migration):
@@ -1,78 +1,187 @@
 from django.db import migrations
 
+SIGNUP_FIELDS = (
+    {
+        "name": "first_name",
+        "label": "First Name",
+        "field_type": "text",
+        "order": 1,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "first_name",
+        "is_system": False,
+    },
+    {
+        "name": "last_name",
+        "label": "Last Name",
+        "field_type": "text",
+        "order": 2,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "last_name",
+        "is_system": False,
+    },
+    {
+        "name": "email",
+        "label": "Email",
+        "field_type": "text",
+        "order": 3,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "email",
+        "is_system": False,
+    },
+    {
+        "name": "whatsapp_country_code",
+        "label": "Country Code",
+        "field_type": "text",
+        "order": 4,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "whatsapp_country_code",
+        "is_system": False,
+    },
+    {
+        "name": "whatsapp_number",
+        "label": "WhatsApp Number",
+        "field_type": "text",
+        "order": 5,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "whatsapp_number",
+        "is_system": False,
+    },
+    {
+        "name": "last_qualification",
+        "label": "Last Qualification",
+        "field_type": "text",
+        "order": 6,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "last_qualification",
+        "is_system": False,
+    },
+    {
+        "name": "password1",
+        "label": "Create Password",
+        "field_type": "text",
+        "order": 7,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "password1",
+        "is_system": False,
+    },
+    {
+        "name": "password2",
+        "label": "Confirm Password",
+        "field_type": "text",
+        "order": 8,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "password2",
+        "is_system": False,
+    },
+)
+
+LOGIN_FIELDS = (
+    {
+        "name": "username",
+        "label": "Email ID",
+        "field_type": "text",
+        "order": 1,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "username",
+        "is_system": True,
+    },
+    {
+        "name": "password",
+        "label": "Password",
+        "field_type": "text",
+        "order": 2,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "password",
+        "is_system": True,
+    },
+)
+
+JOB_DELETE_FIELDS = (
+    {
+        "name": "notes",
+        "label": "Deletion Notes",
+        "field_type": "textarea",
+        "order": 1,
+        "required_roles": [],
+        "visible_roles": [],
+        "read_only_roles": [],
+        "target_field": "notes",
+        "is_system": False,
+    },
+)
+
+FORMS = (
+    (
+        "signup",
+        {
+            "name": "Signup Form",
+            "description": "User signup configuration.",
+            "allowed_roles": [],
+        },
+        SIGNUP_FIELDS,
+    ),
+    (
+        "login",
+        {
+            "name": "Login Form",
+            "description": "Login form configuration.",
+            "allowed_roles": [],
+        },
+        LOGIN_FIELDS,
+    ),
+    (
+        "job_delete",
+        {
+            "name": "Job Delete Form",
+            "description": "Reason capture for job deletion.",
+            "allowed_roles": ["marketing", "super_admin", "co_super_admin"],
+        },
+        JOB_DELETE_FIELDS,
+    ),
+)
+
 
 def seed_more_forms(apps, schema_editor):
     FormDefinition = apps.get_model("formbuilder", "FormDefinition")
     FormField = apps.get_model("formbuilder", "FormField")
 
-    def ensure_def(slug, name, description, allowed_roles):
-        return FormDefinition.objects.get_or_create(
-            slug=slug,
-            defaults={
-                "name": name,
-                "description": description,
-                "allowed_roles": allowed_roles,
-            },
-        )[0]
+    definitions = []
+    fields = []
+    for slug, defaults, rows in FORMS:
+        definition, _ = FormDefinition.objects.get_or_create(slug=slug, defaults=defaults)
+        definitions.append(definition)
+        fields += [FormField(definition=definition, **row) for row in rows]
 
-    def ensure_field(defn, name, label, ftype, order, required_roles, visible_roles, target, is_system=False):
-        FormField.objects.get_or_create(
-            definition=defn,
-            name=name,
-            defaults={
-                "label": label,
-                "field_type": ftype,
-                "order": order,
-                "required_roles": required_roles,
-                "visible_roles": visible_roles,
-                "read_only_roles": [],
-                "target_field": target,
-                "is_system": is_system,
-            },
+    existing = set(
+        FormField.objects.filter(definition__in=definitions).values_list(
+            "definition_id", "name"
         )
-
-    # Signup form
-    signup = ensure_def(
-        "signup",
-        "Signup Form",
-        "User signup configuration.",
-        [],
-    )
-    signup_fields = [
-        ("first_name", "First Name", "text", 1, [], [], "first_name"),
-        ("last_name", "Last Name", "text", 2, [], [], "last_name"),
-        ("email", "Email", "text", 3, [], [], "email"),
-        ("whatsapp_country_code", "Country Code", "text", 4, [], [], "whatsapp_country_code"),
-        ("whatsapp_number", "WhatsApp Number", "text", 5, [], [], "whatsapp_number"),
-        ("last_qualification", "Last Qualification", "text", 6, [], [], "last_qualification"),
-        ("password1", "Create Password", "text", 7, [], [], "password1"),
-        ("password2", "Confirm Password", "text", 8, [], [], "password2"),
-    ]
-    for name, label, ftype, order, req, vis, target in signup_fields:
-        ensure_field(signup, name, label, ftype, order, req, vis, target)
-
-    # Login form
-    login = ensure_def(
-        "login",
-        "Login Form",
-        "Login form configuration.",
-        [],
     )
-    login_fields = [
-        ("username", "Email ID", "text", 1, [], [], "username"),
-        ("password", "Password", "text", 2, [], [], "password"),
-    ]
-    for name, label, ftype, order, req, vis, target in login_fields:
-        ensure_field(login, name, label, ftype, order, req, vis, target, is_system=True)
-
-    # Job delete form
-    job_delete = ensure_def(
-        "job_delete",
-        "Job Delete Form",
-        "Reason capture for job deletion.",
-        ["marketing", "super_admin", "co_super_admin"],
+    FormField.objects.bulk_create(
+        [f for f in fields if (f.definition_id, f.name) not in existing],
+        batch_size=100,
+        ignore_conflicts=True,
     )
-    ensure_field(job_delete, "notes", "Deletion Notes", "textarea", 1, [], [], "notes")
 
 
 class Migration(migrations.Migration):
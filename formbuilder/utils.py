@@ -1,10 +1,13 @@
 """Helpers to adapt forms using DB-backed schemas."""
 
 from django import forms
+from django.core.cache import cache
 
 from accounts.models import User
 from .models import FormDefinition, FormField
 
+FORM_SCHEMA_TTL = 300  # seconds; FormDefinition/FormField signals expire it sooner
+FORM_SCHEMA_VERSION_KEY = "formfields:version"
 
 ROLE_CHOICES = [
     User.Role.MARKETING,
@@ -14,19 +17,88 @@ ROLE_CHOICES = [
 ]
 
 
+SCHEMA_FIELD_COLUMNS = (
+    "id",
+    "order",
+    "target_field",
+    "visible_roles",
+    "required_roles",
+    "read_only_roles",
+)
+
+
+def _visible(meta, role):
+    roles = meta["visible_roles"] or []
+    return not roles or role in roles
+
+
+def _required(meta, role):
+    roles = meta["required_roles"] or []
+    return role in roles
+
+
+def _load_form_fields(slug, role):
+    """Like get_form_fields, but lets database errors propagate."""
+    definition_id = (
+        FormDefinition.objects.filter(slug=slug, is_active=True)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+        .first()
+    )
+    if definition_id is None:
+        return []
+    fields = list(
+        FormField.objects.filter(definition_id=definition_id)
+        .order_by("order", "id")
+        .values(*SCHEMA_FIELD_COLUMNS)
+    )
+    if role:
+        fields = [f for f in fields if _visible(f, role)]
+    return fields
+
+
 def get_form_fields(slug, role):
+    """Schema columns of the active form's fields as dicts, in display order."""
     try:
-        definition = (
-            FormDefinition.objects.filter(slug=slug, is_active=True).order_by("pk").first()
-        )
+        return _load_form_fields(slug, role)
     except Exception:
         return []
-    if not definition:
-        return []
-    fields = list(definition.fields.order_by("order", "id"))
-    if role:
-        fields = [f for f in fields if f.is_visible_for(role)]
-    return fields
+
+
+def invalidate_form_schemas():
+    """Expire every cached form schema; called from form builder save/delete signals."""
+    try:
+        cache.incr(FORM_SCHEMA_VERSION_KEY)
+    except ValueError:
+        cache.set(FORM_SCHEMA_VERSION_KEY, 1, None)
+
+
+def get_form_schema(slug, role):
+    """
+    The per-role layout apply_schema_to_form needs, as plain dicts in schema
+    order, cached so form renders skip the form builder queries.
+    """
+    version = cache.get_or_set(FORM_SCHEMA_VERSION_KEY, 1, None)
+    cache_key = f"formfields:{version}:{slug}:{role}"
+    schema = cache.get(cache_key)
+    if schema is None:
+        try:
+            fields = _load_form_fields(slug, role)
+        except Exception:
+            # Fall back to the unmodified form for this render only; caching
+            # the empty schema would drop required/hidden rules for the TTL.
+            return []
+        schema = [
+            {
+                "target_field": f["target_field"],
+                "visible": _visible(f, role),
+                "required": _required(f, role),
+                "read_only": bool(f["read_only_roles"] and role in f["read_only_roles"]),
+            }
+            for f in fields
+        ]
+        cache.set(cache_key, schema, FORM_SCHEMA_TTL)
+    return schema
 
 
 def apply_schema_to_form(form, slug, role):
@@ -36,46 +108,24 @@ def apply_schema_to_form(form, slug, role):
     if role == User.Role.FLOOR:
         role_for_schema = User.Role.MARKETING
 
-    fields = get_form_fields(slug, role_for_schema)
+    fields = get_form_schema(slug, role_for_schema)
     if not fields:
         return
-    # Ensure ordering based on schema
-    ordered_names = [f.target_field for f in fields]
-
-    # Build lookup keyed by target_field
-    by_target = {f.target_field: f for f in fields}
-    remove_keys = []
-    for name, field in form.fields.items():
-        meta = by_target.get(name)
-        if not meta:
-            continue
-        # Visibility
-        if not meta.is_visible_for(role_for_schema):
-            remove_keys.append(name)
+    by_target = {f["target_field"]: f for f in fields}
+    # One pass in schema order: drop hidden fields, apply flags, reorder.
+    ordered = {}
+    for name, meta in by_target.items():
+        field = form.fields.get(name)
+        if field is None or not meta["visible"]:
             continue
-        # Required toggle
-        field.required = meta.is_required_for(role_for_schema)
-        # Read-only
-        if meta.read_only_roles and role_for_schema in meta.read_only_roles:
-            field.widget.attrs["readonly"] = True
-            field.widget.attrs["disabled"] = True
-    for key in remove_keys:
-        form.fields.pop(key, None)
-    # Reorder fields to match schema order
-    try:
-        from collections import OrderedDict
-
-        new_fields = OrderedDict()
-        for name in ordered_names:
-            if name in form.fields:
-                new_fields[name] = form.fields[name]
-        # append any remaining fields
-        for name, field in form.fields.items():
-            if name not in new_fields:
-                new_fields[name] = field
-        form.fields = new_fields
-    except Exception:
-        pass
+        field.required = meta["required"]
+        if meta["read_only"]:
+            field.widget.attrs.update(readonly=True, disabled=True)
+        ordered[name] = field
+    for name, field in form.fields.items():
+        if name not in by_target:
+            ordered[name] = field
+    form.fields = ordered
 
 
 def choices_for_roles():
@@ -7,11 +7,18 @@ class JobAttachmentInline(admin.TabularInline):
     model = JobAttachment
     extra = 0
 
+    def get_queryset(self, request):
+        # each row's label is built from job.system_id
+        return super().get_queryset(request).select_related("job")
+
 
 class JobContentSectionInline(admin.TabularInline):
     model = JobContentSection
     extra = 0
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("job")
+
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
@@ -27,4 +34,5 @@ class JobAdmin(admin.ModelAdmin):
     )
     list_filter = ("is_superadmin_approved", "status", "is_deleted")
     search_fields = ("job_id_customer", "system_id")
+    list_select_related = ("created_by",)
     inlines = [JobAttachmentInline, JobContentSectionInline]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0007_section_history"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["expected_deadline"], name="job_expected_deadline_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["strict_deadline"], name="job_strict_deadline_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+import jobs.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0009_job_active_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="job",
+            name="system_id",
+            field=models.CharField(
+                default=jobs.models.generate_system_id,
+                editable=False,
+                max_length=32,
+                unique=True,
+            ),
+        ),
+    ]
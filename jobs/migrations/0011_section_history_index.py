@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0010_job_system_id_default"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobcontentsectionhistory",
+            index=models.Index(fields=["section", "-created_at"], name="jchs_section_ctime_idx"),
+        ),
+    ]
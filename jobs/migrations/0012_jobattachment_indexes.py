@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0011_section_history_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobattachment",
+            index=models.Index(fields=["job", "-uploaded_at"], name="jobatt_job_uploaded_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="jobattachment",
+            index=models.Index(fields=["-uploaded_at"], name="jobatt_uploaded_idx"),
+        ),
+    ]
@@ -1,15 +1,32 @@
 """Models representing jobs, holidays, sections, and attachments."""
 
-from datetime import timedelta
+import secrets
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from .choices import ContentSectionType, ContentStatus, JobStatus
 
+HOLIDAY_DATES_CACHE_KEY = "holiday_dates_v1"
+HOLIDAY_DATES_TTL = 60  # seconds; saves invalidate it, the TTL covers other processes
+
+# Section types never change at runtime, so resolve the choices once.
+_SECTION_VALUES = tuple(ContentSectionType.values)
+
+
+def generate_system_id():
+    """Generate system ID like JN-<timestamp><random hex>."""
+
+    # The random suffix keeps concurrent saves in the same microsecond from
+    # colliding on the unique index.
+    timestamp = timezone.now().strftime("%Y%m%d%H%M%S%f")
+    return f"JN-{timestamp}{secrets.token_hex(3)}"
+
 
 class Holiday(models.Model):
     """Dates on which deadlines cannot be scheduled."""
@@ -24,21 +41,31 @@ class Holiday(models.Model):
     def __str__(self):
         return f"Holiday {self.date}"
 
+    @classmethod
+    def dates_set(cls):
+        """Every holiday date as a frozenset, so deadline checks skip the database."""
+        return cache.get_or_set(
+            HOLIDAY_DATES_CACHE_KEY,
+            lambda: frozenset(cls.objects.values_list("date", flat=True)),
+            HOLIDAY_DATES_TTL,
+        )
+
     def clean(self):
         if Holiday.objects.exclude(pk=self.pk).filter(date=self.date).exists():
             raise ValidationError("A holiday already exists for this date.")
 
+        if not self.date:
+            return
+        # Deadlines are stored in UTC, so match the holiday's UTC day as a range
+        # the deadline indexes can serve.
+        day_start = datetime.combine(self.date, time.min, tzinfo=dt_timezone.utc)
+        day_end = day_start + timedelta(days=1)
         Job = apps.get_model("jobs", "Job")
-        conflicts = []
-        for job in Job.objects.all():
-            if job.is_deleted:
-                continue
-            if job.expected_deadline and job.expected_deadline.date() == self.date:
-                conflicts.append(job)
-                continue
-            if job.strict_deadline and job.strict_deadline.date() == self.date:
-                conflicts.append(job)
-        if conflicts:
+        conflicts = Job.objects.active().filter(
+            models.Q(expected_deadline__gte=day_start, expected_deadline__lt=day_end)
+            | models.Q(strict_deadline__gte=day_start, strict_deadline__lt=day_end)
+        )
+        if conflicts.exists():
             raise ValidationError(
                 "Cannot mark this date as holiday due to existing job deadlines."
             )
@@ -68,6 +95,25 @@ class JobQuerySet(models.QuerySet):
             | models.Q(system_id__icontains=term)
         )
 
+    def for_detail(self, with_history=False):
+        """
+        Jobs with everything a detail page renders: the user links, sections
+        in type order and attachments. with_history adds each section's
+        histories, oldest first.
+        """
+        sections = JobContentSection.objects.order_by("section_type")
+        if with_history:
+            sections = sections.prefetch_related(
+                models.Prefetch(
+                    "histories",
+                    queryset=JobContentSectionHistory.objects.order_by("created_at"),
+                )
+            )
+        return self.select_related("created_by", "updated_by", "deleted_by").prefetch_related(
+            models.Prefetch("sections", queryset=sections),
+            "attachments",
+        )
+
 
 class Job(models.Model):
     """Represents the marketing team's job drop."""
@@ -78,7 +124,9 @@ class Job(models.Model):
     job_id_customer = models.CharField(
         "Job ID (From Customer)", max_length=64, unique=True
     )
-    system_id = models.CharField(max_length=32, unique=True, editable=False)
+    system_id = models.CharField(
+        max_length=32, unique=True, editable=False, default=generate_system_id
+    )
     instruction = models.TextField(max_length=10000)
     amount_inr = models.DecimalField(max_digits=12, decimal_places=2)
     expected_deadline = models.DateTimeField()
@@ -112,6 +160,12 @@ class Job(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["expected_deadline"], name="job_expected_deadline_idx"),
+            models.Index(fields=["strict_deadline"], name="job_strict_deadline_idx"),
+            models.Index(fields=["is_deleted", "-created_at"], name="job_active_created_idx"),
+            models.Index(fields=["created_by", "is_deleted"], name="job_owner_active_idx"),
+        ]
 
     def __str__(self):
         return f"{self.job_id_customer} ({self.system_id})"
@@ -128,47 +182,46 @@ class Job(models.Model):
                     "Strict deadline must be at least 24 hours later."
                 )
 
-            expected_date = self.expected_deadline.date()
-            strict_date = self.strict_deadline.date()
-            if Holiday.objects.filter(date=expected_date).exists():
+            holiday_dates = Holiday.dates_set()
+            if self.expected_deadline.date() in holiday_dates:
                 raise ValidationError("Expected deadline falls on a holiday.")
-            if Holiday.objects.filter(date=strict_date).exists():
+            if self.strict_deadline.date() in holiday_dates:
                 raise ValidationError("Strict deadline falls on a holiday.")
 
     def save(self, *args, **kwargs):
-        if not self.system_id:
-            self.system_id = generate_system_id()
+        is_new = self._state.adding
         super().save(*args, **kwargs)
-        ensure_sections_for_job(self)
+        if is_new:
+            # Sections only need creating once; later saves (soft delete,
+            # restore, edits) leave them alone.
+            transaction.on_commit(lambda: ensure_sections_for_job(self))
+
+    def _update_fields(self, **values):
+        """Write the given fields with one UPDATE and mirror them on the instance."""
+        # Lazy import: common.context_processors imports this module.
+        from common.context_processors import invalidate_nav_counts
+
+        values["updated_at"] = timezone.now()
+        Job.objects.filter(pk=self.pk).update(**values)
+        for field, value in values.items():
+            setattr(self, field, value)
+        # update() sends no post_save, which is what normally expires the badges
+        invalidate_nav_counts()
 
     def mark_deleted(self, user, notes=""):
-        self.is_deleted = True
-        self.deleted_by = user
-        self.deletion_notes = notes
-        self.deleted_at = timezone.now()
-        self.save(
-            update_fields=[
-                "is_deleted",
-                "deleted_by",
-                "deletion_notes",
-                "deleted_at",
-                "updated_at",
-            ]
+        self._update_fields(
+            is_deleted=True,
+            deleted_by=user,
+            deletion_notes=notes,
+            deleted_at=timezone.now(),
         )
 
     def restore(self):
-        self.is_deleted = False
-        self.deleted_by = None
-        self.deleted_at = None
-        self.deletion_notes = ""
-        self.save(
-            update_fields=[
-                "is_deleted",
-                "deleted_by",
-                "deleted_at",
-                "deletion_notes",
-                "updated_at",
-            ]
+        self._update_fields(
+            is_deleted=False,
+            deleted_by=None,
+            deleted_at=None,
+            deletion_notes="",
         )
 
 
@@ -181,6 +234,12 @@ class JobAttachment(models.Model):
     uploaded_ip = models.GenericIPAddressField(blank=True, null=True)
     user_agent = models.CharField(max_length=512, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["job", "-uploaded_at"], name="jobatt_job_uploaded_idx"),
+            models.Index(fields=["-uploaded_at"], name="jobatt_uploaded_idx"),
+        ]
+
     def __str__(self):
         return f"{self.job.system_id} attachment"
 
@@ -217,19 +276,40 @@ class JobContentSection(models.Model):
             content=self.content,
         )
 
+    @classmethod
+    def bulk_add_history(cls, sections, action="regenerate"):
+        """add_history for several sections with a single insert."""
+        JobContentSectionHistory.objects.bulk_create(
+            [
+                JobContentSectionHistory(section=s, action=action, content=s.content)
+                for s in sections
+                if s.content
+            ]
+        )
 
-def generate_system_id():
-    """Generate system ID like JN-<timestamp>."""
 
-    timestamp = timezone.now().strftime("%Y%m%d%H%M%S%f")
-    return f"JN-{timestamp}"
+def invalidate_holiday_dates():
+    """Drop the cached holiday dates; called from Holiday save/delete signals."""
+
+    cache.delete(HOLIDAY_DATES_CACHE_KEY)
 
 
 def ensure_sections_for_job(job):
     """Create default content sections once a job is saved."""
 
-    for section_value, _ in ContentSectionType.choices:
-        JobContentSection.objects.get_or_create(job=job, section_type=section_value)
+    # Djongo accepts ignore_conflicts but still sends a plain insert, so skip
+    # the sections that already exist before bulk creating the rest.
+    existing = set(
+        JobContentSection.objects.filter(job=job).values_list("section_type", flat=True)
+    )
+    JobContentSection.objects.bulk_create(
+        [
+            JobContentSection(job=job, section_type=section_value)
+            for section_value in _SECTION_VALUES
+            if section_value not in existing
+        ],
+        ignore_conflicts=True,
+    )
 
 
 class JobContentSectionHistory(models.Model):
@@ -244,6 +324,9 @@ class JobContentSectionHistory(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["section", "-created_at"], name="jchs_section_ctime_idx"),
+        ]
 
     def __str__(self):
         return f"History for {self.section} at {self.created_at}"
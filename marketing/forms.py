@@ -68,12 +68,13 @@ class JobDropForm(forms.ModelForm):
                 )
             expected_date = timezone.localtime(expected).date()
             strict_date = timezone.localtime(strict).date()
-            if Holiday.objects.filter(date=expected_date).exists():
+            holiday_dates = Holiday.dates_set()
+            if expected_date in holiday_dates:
                 self.add_error(
                     "expected_deadline",
                     "Expected deadline falls on a holiday. Please choose another date.",
                 )
-            if Holiday.objects.filter(date=strict_date).exists():
+            if strict_date in holiday_dates:
                 self.add_error(
                     "strict_deadline",
                     "Strict deadline falls on a holiday. Please choose another date.",
@@ -21,8 +21,14 @@ from django.views.generic import DetailView, FormView, TemplateView
 from accounts.forms import GlobalProfileEditForm
 from accounts.models import User
 from common.mixins import ManagementSystemGateMixin
-from common.models import ManagementSystem, Notice, Coupon, CouponRedemption
-from common.utils import format_currency, localize_deadline, to_decimal
+from common.models import ManagementSystem, Coupon, CouponRedemption
+from common.notices import active_notices_for
+from common.utils import (
+    format_currency,
+    localize_deadline,
+    remember_visited_job,
+    to_decimal,
+)
 from jobs.choices import ContentSectionType, ContentStatus
 from jobs.forms import JobDeleteForm
 from jobs.models import Job, Holiday, JobContentSectionHistory, JobContentSection
@@ -84,29 +90,30 @@ def get_monster_cost():
     return MONSTER_GEM_COST_DEFAULT
 
 
+def _coupon_use_counts(user, coupons):
+    """Map coupon id -> times ``user`` redeemed it, in one query."""
+    counts = defaultdict(int)
+    coupon_ids = [c.pk for c in coupons]
+    if not coupon_ids or getattr(user, "pk", None) is None:
+        return counts
+    for coupon_id in CouponRedemption.objects.filter(
+        user=user, coupon_id__in=coupon_ids
+    ).values_list("coupon_id", flat=True):
+        counts[coupon_id] += 1
+    return counts
+
+
 def _coupon_applicable(user, task_key, cost):
     """Return (coupon, discount) best applicable for a user/task."""
-    now = timezone.now()
-    coupons = list(Coupon.objects.all())
-    redemptions = list(CouponRedemption.objects.all())
-    user_id = getattr(user, "pk", None)
+    coupons = list(Coupon.objects.currently_valid(user))
+    used_counts = _coupon_use_counts(user, coupons)
     applicable = []
     for c in coupons:
         try:
-            if not c.is_active:
-                continue
-            if c.valid_from and now < c.valid_from:
-                continue
-            if c.valid_to and now > c.valid_to:
-                continue
-            if not c.applies_to_all and user_id:
-                if not c.assigned_users.filter(pk=user_id).exists():
-                    continue
             tasks = c.applicable_tasks or []
             if tasks and task_key not in tasks:
                 continue
-            used = len([r for r in redemptions if r.coupon_id == c.id and r.user_id == user_id])
-            if used >= c.max_uses_per_user:
+            if used_counts[c.pk] >= c.max_uses_per_user:
                 continue
             applicable.append(c)
         except Exception:
@@ -135,7 +142,7 @@ def _apply_coupon(user, task_key, cost, code=None):
     if not code:
         return None, cost, Decimal("0"), "ok", False
     try:
-        coupon = Coupon.objects.filter(code__iexact=code.strip()).first()
+        coupon = Coupon.objects.filter(code=code.strip().upper()).first()
     except Exception:
         coupon = None
     if not coupon:
@@ -547,7 +554,7 @@ class GlobalNoticeListView(GlobalAccessMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
-            context["notices"] = list(Notice.active_for_user(self.request.user))
+            context["notices"] = active_notices_for(self.request.user)
         except Exception:
             context["notices"] = []
         return context
@@ -562,19 +569,11 @@ class GlobalCouponsView(GlobalAccessMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         user = self.request.user
         available = []
-        now = timezone.now()
-        coupons = list(Coupon.objects.all())
+        coupons = list(Coupon.objects.currently_valid(user))
+        used_counts = _coupon_use_counts(user, coupons)
         for c in coupons:
             try:
-                if not c.is_active:
-                    continue
-                if not c.is_valid_for_user(user):
-                    continue
-                if c.valid_from and now < c.valid_from:
-                    continue
-                if c.valid_to and now > c.valid_to:
-                    continue
-                used = CouponRedemption.objects.filter(coupon=c, user=user).count()
+                used = used_counts[c.pk]
                 if used >= c.max_uses_per_user:
                     continue
                 available.append(
@@ -1612,15 +1611,13 @@ class JobDetailView(MarketingAccessMixin, DetailView):
     context_object_name = "job"
 
     def get_queryset(self):
-        return Job.objects.filter(created_by=self.request.user)
+        return Job.objects.filter(created_by=self.request.user).for_detail(with_history=True)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         job = context["job"]
-        visited = set(self.request.session.get("visited_job_ids", []))
-        if job.pk not in visited:
-            visited.add(job.pk)
-            self.request.session["visited_job_ids"] = list(visited)
+        remember_visited_job(self.request.session, job.pk)
+        section_map = {section.section_type: section for section in job.sections.all()}
         # Gems balance for global users
         if self.request.user.role == User.Role.GLOBAL:
             account = ensure_gems_account(self.request.user, "Ensure balance")
@@ -1628,7 +1625,7 @@ class JobDetailView(MarketingAccessMixin, DetailView):
         sections = []
         sequence = [c[0] for c in ContentSectionType.choices]
         for idx, section_value in enumerate(sequence):
-            section = job.sections.filter(section_type=section_value).first()
+            section = section_map.get(section_value)
             if section:
                 section.viewable = True  # marketing owner can always view
                 # gate: previous section must be approved
@@ -1636,10 +1633,10 @@ class JobDetailView(MarketingAccessMixin, DetailView):
                     section.prev_approved = True
                 else:
                     prev_type = sequence[idx - 1]
-                    prev_section = job.sections.filter(section_type=prev_type).first()
+                    prev_section = section_map.get(prev_type)
                     section.prev_approved = prev_section and prev_section.status == ContentStatus.APPROVED
                 # Build fixed slots: 1, 2, 3 generation attempts + Approved slot
-                history_entries = list(section.histories.order_by("created_at"))  # oldest first
+                history_entries = list(section.histories.all())  # oldest first, prefetched
 
                 def _placeholder(label):
                     return SimpleNamespace(
@@ -1787,16 +1784,24 @@ class MarketingSectionActionView(MarketingAccessMixin, View):
             if not self._charge_gems(request.user, MONSTER_GEM_COST, "Monster generation"):
                 messages.error(request, "Not enough gems for Monster generation (10 required).")
                 return redirect(redirect_url)
-            for stype in self.GENERATION_ORDER:
-                sec = section.job.sections.filter(section_type=stype).first()
-                if not sec:
-                    continue
+            sections_by_type = {s.section_type: s for s in section.job.sections.all()}
+            ordered = [
+                sections_by_type[stype]
+                for stype in self.GENERATION_ORDER
+                if stype in sections_by_type
+            ]
+            # Each section is only overwritten in its own turn below, so the
+            # current content can be archived for all of them up front.
+            JobContentSection.bulk_add_history(
+                [sec for sec in ordered if sec.section_type not in self.AI_PLAG_SET],
+                action="monster",
+            )
+            for sec in ordered:
                 if sec.section_type in self.AI_PLAG_SET:
                     sec.content = "AI/Plag Report not available."
                     sec.status = ContentStatus.REGENERATE
                     sec.save(update_fields=["content", "status", "updated_at"])
                     continue
-                sec.add_history(action="monster")
                 sec.content = self._generate_section_content(sec, regenerate=sec.regeneration_count > 0)
                 sec.regeneration_count = max(sec.regeneration_count, 1)
                 sec.status = ContentStatus.REGENERATE
@@ -34,6 +34,7 @@ except Exception:
 from accounts.models import ProfileUpdateRequest, User, GemsAccount, GemTransaction
 from accounts.views import ensure_gems_account
 from common.mixins import ManagementSystemGateMixin
+from common.notices import FALLBACK_NOTICES_KEY
 from common.models import (
     ManagementSystem,
     Notice,
@@ -44,8 +45,9 @@ from common.models import (
     Coupon,
     CouponRedemption,
 )
+from accounts.hashers import GeneratedPasswordHasher
 from accounts.models import User, FloorSignupRequest
-from common.utils import format_currency, to_decimal
+from common.utils import format_currency, remember_visited_job, to_decimal
 from jobs.choices import ContentSectionType, ContentStatus, JobStatus
 from jobs.forms import JobDeleteForm
 from jobs.models import Holiday, Job, JobContentSection, JobAttachment
@@ -88,6 +90,8 @@ from .forms import (
 )
 
 
+LOG_BATCH_SIZE = 500
+
 SECTION_SEQUENCE = [
     ContentSectionType.SUMMARY,
     ContentSectionType.STRUCTURE,
@@ -745,18 +749,19 @@ class JobDetailView(SuperAdminAccessMixin, DetailView):
     context_object_name = "job"
     management_system_key = ManagementSystem.Keys.WEBSITE_CONTENT
 
+    def get_queryset(self):
+        return Job.objects.for_detail()
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         job = context["job"]
-        visited = set(self.request.session.get("visited_job_ids", []))
-        if job.pk not in visited:
-            visited.add(job.pk)
-            self.request.session["visited_job_ids"] = list(visited)
-        sections = []
-        for section_value in SECTION_SEQUENCE:
-            section = job.sections.filter(section_type=section_value).first()
-            if section:
-                sections.append(section)
+        remember_visited_job(self.request.session, job.pk)
+        section_map = {section.section_type: section for section in job.sections.all()}
+        sections = [
+            section_map[section_value]
+            for section_value in SECTION_SEQUENCE
+            if section_value in section_map
+        ]
         context["sections"] = sections
         context["attachments"] = job.attachments.all()
         return context
@@ -1005,15 +1010,24 @@ class GlobalUserManagementView(SuperAdminAccessMixin, TemplateView):
                 GemCostRule.Keys.CONTENT: request.POST.get("cost_content"),
                 GemCostRule.Keys.MONSTER: request.POST.get("cost_monster"),
             }
+            costs = {}
             for key, raw in updates.items():
                 if raw is None or raw == "":
                     continue
                 try:
-                    val = Decimal(str(raw))
-                    GemCostRule.objects.update_or_create(key=key, defaults={"cost": val})
+                    costs[key] = Decimal(str(raw))
                 except Exception:
                     messages.error(request, f"Invalid cost value for {key}.")
                     return redirect("superadmin:global_users")
+            # one read for all rules; only rows whose cost changed are written
+            rules = {rule.key: rule for rule in GemCostRule.objects.filter(key__in=list(costs))}
+            for key, val in costs.items():
+                rule = rules.get(key)
+                if rule is None:
+                    GemCostRule.objects.create(key=key, cost=val)
+                elif self._coerce_decimal(rule.cost) != val:
+                    rule.cost = val
+                    rule.save(update_fields=["cost", "updated_at"])
             messages.success(request, "Gem cost rules updated.")
             return redirect("superadmin:global_users")
 
@@ -1238,20 +1252,6 @@ class NoticeManagementView(SuperAdminAccessMixin, TemplateView):
             notice = Notice.objects.filter(pk=notice_id).first()
             if notice:
                 notice.delete()
-                # refresh cache with remaining notices instead of clearing everything
-                remaining = list(
-                    Notice.objects.values(
-                        "id",
-                        "title",
-                        "message",
-                        "start_at",
-                        "end_at",
-                        "is_active",
-                        "show_on_marketing",
-                        "show_on_global",
-                    )
-                )
-                cache.set("fallback_notices", remaining, None)
                 messages.success(request, "Notice expired and removed.")
             else:
                 messages.error(request, "Notice not found.")
@@ -1301,23 +1301,6 @@ class NoticeManagementView(SuperAdminAccessMixin, TemplateView):
         notice.updated_by = request.user
         try:
             notice.save()
-            # refresh fallback cache for situations where DB reads are blocked
-            cache.set(
-                "fallback_notices",
-                list(
-                    Notice.objects.values(
-                        "id",
-                        "title",
-                        "message",
-                        "start_at",
-                        "end_at",
-                        "is_active",
-                        "show_on_marketing",
-                        "show_on_global",
-                    )
-                ),
-                None,
-            )
             messages.success(request, "Notice saved.")
         except Exception as exc:
             messages.error(request, f"Could not save notice: {exc}")
@@ -1328,7 +1311,7 @@ class NoticeManagementView(SuperAdminAccessMixin, TemplateView):
         try:
             context["notices"] = Notice.objects.all().order_by("-created_at")
         except Exception:
-            cached = cache.get("fallback_notices", [])
+            cached = cache.get(FALLBACK_NOTICES_KEY, [])
             context["notices"] = cached
             if not cached:
                 messages.error(self.request, "Could not load notices. Please ensure migrations are applied.")
@@ -1418,26 +1401,6 @@ class ActivityLogView(SuperAdminAccessMixin, TemplateView):
         if not old_qs.exists():
             messages.info(self.request, "No logs older than 30 days to archive.")
             return redirect("superadmin:activity_logs")
-        # store in archive table
-        archive_rows = [
-            ActivityLogArchive(
-                user=log.user,
-                path=log.path,
-                method=log.method,
-                status_code=log.status_code,
-                ip_address=log.ip_address,
-                user_agent=log.user_agent,
-                referrer=log.referrer,
-                duration_ms=log.duration_ms,
-                action_type=log.action_type,
-                extra_meta=log.extra_meta,
-                session_key=log.session_key,
-                created_at=log.created_at,
-            )
-            for log in old_qs
-        ]
-        ActivityLogArchive.objects.bulk_create(archive_rows)
-        # also provide CSV download
         import csv
         response = HttpResponse(content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="activity_logs_archive.csv"'
@@ -1457,7 +1420,25 @@ class ActivityLogView(SuperAdminAccessMixin, TemplateView):
                 "Referrer",
             ]
         )
-        for log in old_qs:
+        # one pass over the old rows feeds both the archive table and the CSV
+        archive_rows = []
+        for log in old_qs.select_related("user").iterator():
+            archive_rows.append(
+                ActivityLogArchive(
+                    user=log.user,
+                    path=log.path,
+                    method=log.method,
+                    status_code=log.status_code,
+                    ip_address=log.ip_address,
+                    user_agent=log.user_agent,
+                    referrer=log.referrer,
+                    duration_ms=log.duration_ms,
+                    action_type=log.action_type,
+                    extra_meta=log.extra_meta,
+                    session_key=log.session_key,
+                    created_at=log.created_at,
+                )
+            )
             user = log.user.get_full_name() if log.user else "Anonymous"
             role = getattr(log.user, "get_role_display", lambda: "")()
             writer.writerow(
@@ -1475,6 +1456,7 @@ class ActivityLogView(SuperAdminAccessMixin, TemplateView):
                     log.referrer,
                 ]
             )
+        ActivityLogArchive.objects.bulk_create(archive_rows, batch_size=LOG_BATCH_SIZE)
         # delete archived
         old_qs.delete()
         return response
@@ -1482,7 +1464,8 @@ class ActivityLogView(SuperAdminAccessMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         qs, start, end = self._filter_queryset(self.request)
-        paginator = Paginator(qs, 10)
+        # the table never shows the JSON payload or session/referrer columns
+        paginator = Paginator(qs.defer("extra_meta", "session_key", "referrer"), 10)
         page_number = self.request.GET.get("page")
         page_obj = paginator.get_page(page_number)
         context["logs"] = page_obj
@@ -1599,23 +1582,6 @@ class ErrorLogView(SuperAdminAccessMixin, TemplateView):
         if not old_qs.exists():
             messages.info(self.request, "No error logs older than 30 days to archive.")
             return redirect("superadmin:error_logs")
-        archive_rows = [
-            ErrorLogArchive(
-                user=log.user,
-                path=log.path,
-                method=log.method,
-                status_code=log.status_code,
-                message=log.message,
-                traceback=log.traceback,
-                ip_address=log.ip_address,
-                user_agent=log.user_agent,
-                referrer=log.referrer,
-                resolved=log.resolved,
-                created_at=log.created_at,
-            )
-            for log in old_qs
-        ]
-        ErrorLogArchive.objects.bulk_create(archive_rows)
         import csv
         response = HttpResponse(content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="error_logs_archive.csv"'
@@ -1635,7 +1601,24 @@ class ErrorLogView(SuperAdminAccessMixin, TemplateView):
                 "Resolved",
             ]
         )
-        for log in old_qs:
+        # one pass over the old rows feeds both the archive table and the CSV
+        archive_rows = []
+        for log in old_qs.select_related("user").iterator():
+            archive_rows.append(
+                ErrorLogArchive(
+                    user=log.user,
+                    path=log.path,
+                    method=log.method,
+                    status_code=log.status_code,
+                    message=log.message,
+                    traceback=log.traceback,
+                    ip_address=log.ip_address,
+                    user_agent=log.user_agent,
+                    referrer=log.referrer,
+                    resolved=log.resolved,
+                    created_at=log.created_at,
+                )
+            )
             user = log.user.get_full_name() if log.user else "Anonymous"
             role = getattr(log.user, "get_role_display", lambda: "")()
             writer.writerow(
@@ -1653,6 +1636,7 @@ class ErrorLogView(SuperAdminAccessMixin, TemplateView):
                     "Yes" if log.resolved else "No",
                 ]
             )
+        ErrorLogArchive.objects.bulk_create(archive_rows, batch_size=LOG_BATCH_SIZE)
         old_qs.delete()
         return response
 
@@ -1680,7 +1664,7 @@ class ErrorLogView(SuperAdminAccessMixin, TemplateView):
             }
             context["total_logs"] = qs.count()
             # show most recent traceback for preview
-            context["latest_traceback"] = qs.first().traceback if qs else ""
+            context["latest_traceback"] = qs.values_list("traceback", flat=True).first() or ""
         except Exception:
             context["logs"] = []
             context["logs_paginator"] = None
@@ -1707,13 +1691,19 @@ class LogRestoreView(SuperAdminAccessMixin, TemplateView):
             messages.error(request, f"Could not read CSV: {exc}")
             return redirect("superadmin:log_restore")
 
-        created = 0
+        model = ActivityLog if log_type == "activity" else ErrorLog
+        rows = []
         failed = 0
         for row in reader:
             try:
-                created += self._restore_row(log_type, row)
+                rows.append(self._build_row(log_type, row))
             except Exception:
                 failed += 1
+        try:
+            created = len(model.objects.bulk_create(rows, batch_size=LOG_BATCH_SIZE))
+        except Exception as exc:
+            messages.error(request, f"Could not restore logs: {exc}")
+            return redirect("superadmin:log_restore")
         if created:
             messages.success(request, f"Restored {created} {log_type} log(s).")
         if failed:
@@ -1726,9 +1716,9 @@ class LogRestoreView(SuperAdminAccessMixin, TemplateView):
         except Exception:
             return timezone.now()
 
-    def _restore_row(self, log_type, row):
+    def _build_row(self, log_type, row):
         if log_type == "activity":
-            ActivityLog.objects.create(
+            return ActivityLog(
                 user=None,
                 path=row.get("Path", "")[:512],
                 method=row.get("Method", "")[:10],
@@ -1742,22 +1732,19 @@ class LogRestoreView(SuperAdminAccessMixin, TemplateView):
                 extra_meta={},
                 created_at=self._parse_ts(row.get("Timestamp") or timezone.now().isoformat()),
             )
-            return 1
-        else:
-            ErrorLog.objects.create(
-                user=None,
-                path=row.get("Path", "")[:512],
-                method=row.get("Method", "")[:10],
-                status_code=int(row.get("Status", 500) or 500),
-                message=row.get("Message", "")[:2000],
-                traceback=row.get("Traceback", "")[:8000] if row.get("Traceback") else "",
-                ip_address=row.get("IP", "") or None,
-                user_agent=row.get("Browser", "")[:512],
-                referrer=row.get("Referrer", "")[:512],
-                resolved=(row.get("Resolved", "").lower() in {"yes", "true", "1"}),
-                created_at=self._parse_ts(row.get("Timestamp") or timezone.now().isoformat()),
-            )
-            return 1
+        return ErrorLog(
+            user=None,
+            path=row.get("Path", "")[:512],
+            method=row.get("Method", "")[:10],
+            status_code=int(row.get("Status", 500) or 500),
+            message=row.get("Message", "")[:2000],
+            traceback=row.get("Traceback", "")[:8000] if row.get("Traceback") else "",
+            ip_address=row.get("IP", "") or None,
+            user_agent=row.get("Browser", "")[:512],
+            referrer=row.get("Referrer", "")[:512],
+            resolved=(row.get("Resolved", "").lower() in {"yes", "true", "1"}),
+            created_at=self._parse_ts(row.get("Timestamp") or timezone.now().isoformat()),
+        )
 
 
 class HolidayManagementView(SuperAdminAccessMixin, TemplateView):
@@ -1925,7 +1912,6 @@ class CouponManagementView(SuperAdminAccessMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        coupons = list(Coupon.objects.all().order_by("-valid_to", "code"))
         global_users = User.objects.filter(role=User.Role.GLOBAL).order_by("email")
         coupons_qs = Coupon.objects.all().order_by("-valid_to", "code")
         coupon_paginator = Paginator(coupons_qs, 5)
@@ -2095,25 +2081,22 @@ class FloorSignupRequestListView(SuperAdminAccessMixin, TemplateView):
                 )
                 return redirect("superadmin:floor_signup_requests")
             username, password = req.generate_credentials()
-            # if somehow username already exists, regenerate until unique
-            attempts = 0
-            while User.objects.filter(floor_username=username).exists() and attempts < 5:
-                username, password = req.generate_credentials()
-                attempts += 1
             try:
-                user = User.objects.create_user(
+                # a username clash is retried with a fresh one inside create_floor_user
+                user = User.objects.create_floor_user(
+                    password,
                     email=req.email,
-                    password=password,
+                    floor_username=username,
+                    password_hasher=GeneratedPasswordHasher.algorithm,
                     first_name=req.first_name,
                     last_name=req.last_name,
-                    role=User.Role.FLOOR,
                     whatsapp_country_code=req.whatsapp_country_code,
                     whatsapp_number=req.whatsapp_number,
                     last_qualification=req.last_qualification,
                     is_account_approved=True,
                     is_active=True,
-                    floor_username=username,
                 )
+                username = user.floor_username
                 req.generated_username = username
                 req.generated_password = password
                 req.status = FloorSignupRequest.Status.APPROVED